@@ -1,7 +1,9 @@
 """Define the HEOS command module."""
 
 import logging
+from collections.abc import Iterable
 from enum import ReprEnum
+from functools import lru_cache
 from typing import Any, Final, TypeVar
 
 REPORT_ISSUE_TEXT: Final = (
@@ -82,6 +84,8 @@ ATTR_WILDCARD: Final = "wildcard"
 
 VALUE_ON: Final = "on"
 VALUE_OFF: Final = "off"
+# Indexed by a state passed through bool(): VALUE_OFF_ON[False] == VALUE_OFF, VALUE_OFF_ON[True] == VALUE_ON
+VALUE_OFF_ON: Final = (VALUE_OFF, VALUE_ON)
 VALUE_TRUE: Final = "true"
 VALUE_FALSE: Final = "false"
 VALUE_YES: Final = "yes"
@@ -155,6 +159,9 @@ COMMAND_REBOOT: Final = "system/reboot"
 COMMAND_SIGN_IN: Final = "system/sign_in"
 COMMAND_SIGN_OUT: Final = "system/sign_out"
 
+# Maximum length of string parameters
+MAX_PARAMETER_LENGTH: Final = 128
+
 _LOGGER: Final = logging.getLogger(__name__)
 
 TEnum = TypeVar("TEnum", bound=ReprEnum)
@@ -166,6 +173,33 @@ def optional_int(value: str | None) -> int | None:
     return None
 
 
+def check_range(value: int, minimum: int, maximum: int, name: str) -> None:
+    """Raise a ValueError if the value is outside the inclusive range."""
+    if not minimum <= value <= maximum:
+        raise ValueError(f"'{name}' must be in the range {minimum}-{maximum}")
+
+
+def check_length(value: str, name: str, *, allow_empty: bool = False) -> None:
+    """Raise a ValueError if the parameter is empty or longer than the CLI allows."""
+    if not value and not allow_empty:
+        raise ValueError(f"'{name}' parameter must not be empty")
+    if len(value) > MAX_PARAMETER_LENGTH:
+        raise ValueError(
+            f"'{name}' parameter must be less than or equal to {MAX_PARAMETER_LENGTH} characters"
+        )
+
+
+@lru_cache(maxsize=512)
+def format_range(range_start: int, range_end: int) -> str:
+    """Format the range parameter value. Cached as the same pages are typically requested repeatedly."""
+    return f"{range_start},{range_end}"
+
+
+def join_ids(ids: Iterable[int]) -> str:
+    """Format the identifiers as a comma-separated parameter value."""
+    return ",".join([str(item_id) for item_id in ids])
+
+
 def parse_enum(
     key: str, data: dict[str, Any], enum_type: type[TEnum], default: TEnum
 ) -> TEnum:
@@ -9,14 +9,19 @@ Not implemented (commands do not exist/obsolete):
     4.4.18 Get Service Options for now playing screen: OBSOLETE
 """
 
-from collections.abc import Sequence
-from typing import TYPE_CHECKING, Any, cast
+import asyncio
+import time
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass
+from functools import cached_property, partial
+from typing import TYPE_CHECKING, Any, Final, cast
 
 from pyheos import command as c
 from pyheos.command.connection import ConnectionMixin
 from pyheos.const import (
     MUSIC_SOURCE_AUX_INPUT,
     MUSIC_SOURCE_FAVORITES,
+    MUSIC_SOURCE_HISTORY,
     MUSIC_SOURCE_PLAYLISTS,
     SEARCHED_TRACKS,
     SERVICE_OPTION_ADD_ALBUM_TO_LIBRARY,
@@ -47,6 +52,124 @@ from pyheos.types import AddCriteriaType, MediaType
 if TYPE_CHECKING:
     from pyheos.heos import Heos
 
+# Set for constant time membership tests of the input media ids
+_VALID_INPUTS: Final = frozenset(VALID_INPUTS)
+# The maximum number of browse results held in the cache
+_BROWSE_CACHE_MAX_SIZE: Final = 256
+
+# Commands without variable parameters are built once and reused
+_GET_MUSIC_SOURCES: Final = HeosCommand(c.COMMAND_BROWSE_GET_SOURCES)
+_GET_MUSIC_SOURCES_REFRESH: Final = HeosCommand(
+    c.COMMAND_BROWSE_GET_SOURCES, {c.ATTR_REFRESH: c.VALUE_ON}
+)
+
+
+@dataclass(frozen=True)
+class _ServiceOptionSpec:
+    """Define the parameters required and not allowed for a service option."""
+
+    required: tuple[str, ...]
+    disallowed: tuple[str, ...]
+
+    @cached_property
+    def required_mask(self) -> int:
+        """Get the bitmask of the required parameters."""
+        return _param_mask(self.required)
+
+    @cached_property
+    def disallowed_mask(self) -> int:
+        """Get the bitmask of the parameters that are not allowed."""
+        return _param_mask(self.disallowed)
+
+    @cached_property
+    def required_text(self) -> str:
+        """Get the text describing the required parameters for error messages."""
+        if len(self.required) == 1:
+            return f"{self.required[0]} parameter is"
+        if len(self.required) == 2:
+            return f"{self.required[0]} and {self.required[1]} parameters are"
+        return (
+            f"{', '.join(self.required[:-1])}, and {self.required[-1]} parameters are"
+        )
+
+
+# Bit assigned to each set_service_option parameter for validation
+_SOURCE_ID_BIT: Final = 1
+_CONTAINER_ID_BIT: Final = 2
+_MEDIA_ID_BIT: Final = 4
+_PLAYER_ID_BIT: Final = 8
+_NAME_BIT: Final = 16
+_CRITERIA_ID_BIT: Final = 32
+_RANGE_START_BIT: Final = 64
+_RANGE_END_BIT: Final = 128
+_SERVICE_OPTION_BITS: Final = {
+    "source_id": _SOURCE_ID_BIT,
+    "container_id": _CONTAINER_ID_BIT,
+    "media_id": _MEDIA_ID_BIT,
+    "player_id": _PLAYER_ID_BIT,
+    "name": _NAME_BIT,
+    "criteria_id": _CRITERIA_ID_BIT,
+    "range_start": _RANGE_START_BIT,
+    "range_end": _RANGE_END_BIT,
+}
+
+
+def _param_mask(params: Iterable[str]) -> int:
+    """Get the bitmask of the set_service_option parameters."""
+    mask = 0
+    for param in params:
+        mask |= _SERVICE_OPTION_BITS[param]
+    return mask
+
+
+_TRACK_STATION_SPEC: Final = _ServiceOptionSpec(
+    ("source_id", "media_id"),
+    ("container_id", "player_id", "name", "criteria_id", "range_start", "range_end"),
+)
+_ALBUM_PLAYLIST_SPEC: Final = _ServiceOptionSpec(
+    ("source_id", "container_id"),
+    ("media_id", "player_id", "name", "criteria_id", "range_start", "range_end"),
+)
+_THUMBS_SPEC: Final = _ServiceOptionSpec(
+    ("source_id", "player_id"),
+    ("media_id", "container_id", "name", "criteria_id", "range_start", "range_end"),
+)
+_SERVICE_OPTION_SPECS: Final[dict[int, _ServiceOptionSpec]] = {
+    SERVICE_OPTION_ADD_TRACK_TO_LIBRARY: _TRACK_STATION_SPEC,
+    SERVICE_OPTION_ADD_STATION_TO_LIBRARY: _TRACK_STATION_SPEC,
+    SERVICE_OPTION_REMOVE_TRACK_FROM_LIBRARY: _TRACK_STATION_SPEC,
+    SERVICE_OPTION_REMOVE_STATION_FROM_LIBRARY: _TRACK_STATION_SPEC,
+    SERVICE_OPTION_ADD_ALBUM_TO_LIBRARY: _ALBUM_PLAYLIST_SPEC,
+    SERVICE_OPTION_REMOVE_ALBUM_FROM_LIBRARY: _ALBUM_PLAYLIST_SPEC,
+    SERVICE_OPTION_REMOVE_PLAYLIST_FROM_LIBRARY: _ALBUM_PLAYLIST_SPEC,
+    SERVICE_OPTION_ADD_PLAYLIST_TO_LIBRARY: _ServiceOptionSpec(
+        ("source_id", "container_id", "name"),
+        ("media_id", "player_id", "criteria_id", "range_start", "range_end"),
+    ),
+    SERVICE_OPTION_THUMBS_UP: _THUMBS_SPEC,
+    SERVICE_OPTION_THUMBS_DOWN: _THUMBS_SPEC,
+    SERVICE_OPTION_CREATE_NEW_STATION_BY_SEARCH_CRITERIA: _ServiceOptionSpec(
+        ("source_id", "name", "criteria_id"),
+        ("media_id", "container_id", "player_id"),
+    ),
+    # Required parameters are validated separately as player_id is an alternative
+    SERVICE_OPTION_ADD_TO_FAVORITES: _ServiceOptionSpec(
+        (), ("container_id", "criteria_id", "range_start", "range_end")
+    ),
+    SERVICE_OPTION_REMOVE_FROM_FAVORITES: _ServiceOptionSpec(
+        ("media_id",),
+        (
+            "source_id",
+            "player_id",
+            "container_id",
+            "name",
+            "criteria_id",
+            "range_start",
+            "range_end",
+        ),
+    ),
+}
+
 
 class BrowseCommands(ConnectionMixin):
     """A mixin to provide access to the browse commands."""
@@ -57,6 +180,12 @@ class BrowseCommands(ConnectionMixin):
 
         self._music_sources: dict[int, MediaMusicSource] = {}
         self._music_sources_loaded = False
+        self._search_criteria: dict[int, list[SearchCriteria]] = {}
+        self._browse_cache: dict[
+            tuple[int, str | None, str | None], tuple[float, BrowseResult]
+        ] = {}
+        # Incremented when the cache is cleared so in-flight results are not stored
+        self._browse_cache_generation = 0
 
     @property
     def music_sources(self) -> dict[int, MediaMusicSource]:
@@ -73,16 +202,21 @@ class BrowseCommands(ConnectionMixin):
             4.4.1 Get Music Sources
         """
         if not self._music_sources_loaded or refresh:
-            params = {}
-            if refresh:
-                params[c.ATTR_REFRESH] = c.VALUE_ON
-            message = await self._connection.command(
-                HeosCommand(c.COMMAND_BROWSE_GET_SOURCES, params)
+            # Concurrent loads share a single command to avoid a refresh stampede. A refresh
+            # does not reuse a response that was already in flight, as it may predate a change.
+            message = await self._coalesced_command(
+                _GET_MUSIC_SOURCES_REFRESH if refresh else _GET_MUSIC_SOURCES,
+                fresh=refresh,
+            )
+            heos = cast("Heos", self)
+            sources = (
+                MediaMusicSource.from_data(data, heos)
+                for data in cast(Sequence[dict], message.payload)
             )
+            loaded = {source.source_id: source for source in sources}
+            # Update in place so references to the music_sources property stay current
             self._music_sources.clear()
-            for data in cast(Sequence[dict], message.payload):
-                source = MediaMusicSource.from_data(data, cast("Heos", self))
-                self._music_sources[source.source_id] = source
+            self._music_sources.update(loaded)
             self._music_sources_loaded = True
         return self._music_sources
 
@@ -131,9 +265,13 @@ class BrowseCommands(ConnectionMixin):
         container_id: str | None = None,
         range_start: int | None = None,
         range_end: int | None = None,
+        *,
+        refresh: bool = False,
     ) -> BrowseResult:
         """Browse the contents of the specified source or container.
 
+        Results are cached for the browse_cache_ttl option. Changes made by another controller are not reported by an event, so results may be stale for up to the TTL unless refresh is set. A cached result is shared between callers, so its items and options are tuples.
+
         References:
             4.4.3 Browse Source
             4.4.4 Browse Source Containers
@@ -145,18 +283,67 @@ class BrowseCommands(ConnectionMixin):
             container_id: The identifier of the container to browse. If not provided, the root of the source will be expanded.
             range_start: The index of the first item to return. Both range_start and range_end must be provided to return a range of items.
             range_end: The index of the last item to return. Both range_start and range_end must be provided to return a range of items.
+            refresh: Set to True to bypass the cached result. The default is False.
         Returns:
             A BrowseResult instance containing the items in the source or container.
         """
         params: dict[str, Any] = {c.ATTR_SOURCE_ID: source_id}
         if container_id:
             params[c.ATTR_CONTAINER_ID] = container_id
-        if isinstance(range_start, int) and isinstance(range_end, int):
-            params[c.ATTR_RANGE] = f"{range_start},{range_end}"
-        message = await self._connection.command(
-            HeosCommand(c.COMMAND_BROWSE_BROWSE, params)
+        if range_start is not None and range_end is not None:
+            params[c.ATTR_RANGE] = c.format_range(range_start, range_end)
+
+        # History changes whenever media is played, so it is never cached
+        ttl = self._options.browse_cache_ttl
+        cacheable = ttl > 0 and source_id != MUSIC_SOURCE_HISTORY
+        key = (source_id, params.get(c.ATTR_CONTAINER_ID), params.get(c.ATTR_RANGE))
+        if cacheable and not refresh:
+            cached = self._browse_cache.get(key)
+            if cached is not None and time.monotonic() - cached[0] < ttl:
+                return cached[1]
+
+        generation = self._browse_cache_generation
+        # Concurrent callers share the parsed result
+        result = await self._coalesced_call(
+            HeosCommand(c.COMMAND_BROWSE_BROWSE, params),
+            partial(BrowseResult._from_message, heos=cast("Heos", self)),
+            fresh=refresh,
         )
-        return BrowseResult._from_message(message, cast("Heos", self))
+        # Skip storing a result fetched before the cache was cleared
+        if cacheable and generation == self._browse_cache_generation:
+            self._store_browse_result(key, result, ttl)
+        return result
+
+    def _store_browse_result(
+        self,
+        key: tuple[int, str | None, str | None],
+        result: BrowseResult,
+        ttl: float,
+    ) -> None:
+        """Store a browse result, evicting expired and then the oldest entries to bound the cache."""
+        now = time.monotonic()
+        self._browse_cache.pop(key, None)
+        if len(self._browse_cache) >= _BROWSE_CACHE_MAX_SIZE:
+            self._browse_cache = {
+                cache_key: value
+                for cache_key, value in self._browse_cache.items()
+                if now - value[0] < ttl
+            }
+        while len(self._browse_cache) >= _BROWSE_CACHE_MAX_SIZE:
+            del self._browse_cache[next(iter(self._browse_cache))]
+        self._browse_cache[key] = (now, result)
+
+    def _clear_browse_cache(self, source_id: int | None = None) -> None:
+        """Clear cached browse results for the specified source, or all sources if not provided."""
+        self._browse_cache_generation += 1
+        if source_id is None:
+            self._browse_cache.clear()
+        else:
+            self._browse_cache = {
+                key: value
+                for key, value in self._browse_cache.items()
+                if key[0] != source_id
+            }
 
     async def browse_media(
         self,
@@ -190,21 +377,34 @@ class BrowseCommands(ConnectionMixin):
                 media.source_id, media.container_id, range_start, range_end
             )
 
-    async def get_search_criteria(self, source_id: int) -> list[SearchCriteria]:
+    async def get_search_criteria(
+        self, source_id: int, refresh: bool = False
+    ) -> list[SearchCriteria]:
         """
         Create a HEOS command to get the search criteria.
 
+        The search criteria of a source are retained until the sources change.
+
         References:
             4.4.5 Get Search Criteria
+
+        Args:
+            source_id: The identifier of the source.
+            refresh: Set to True to request the search criteria from the device even when already loaded. The default is False.
         """
-        result = await self._connection.command(
-            HeosCommand(
-                c.COMMAND_BROWSE_GET_SEARCH_CRITERIA,
-                {c.ATTR_SOURCE_ID: source_id},
+        criteria = self._search_criteria.get(source_id)
+        if criteria is None or refresh:
+            result = await self._coalesced_command(
+                HeosCommand(
+                    c.COMMAND_BROWSE_GET_SEARCH_CRITERIA,
+                    {c.ATTR_SOURCE_ID: source_id},
+                ),
+                fresh=refresh,
             )
-        )
-        payload = cast(list[dict[str, str]], result.payload)
-        return [SearchCriteria._from_data(data) for data in payload]
+            payload = cast(list[dict[str, str]], result.payload)
+            criteria = [SearchCriteria._from_data(data) for data in payload]
+            self._search_criteria[source_id] = criteria
+        return criteria
 
     async def search(
         self,
@@ -219,19 +419,14 @@ class BrowseCommands(ConnectionMixin):
 
         References:
             4.4.6 Search"""
-        if search == "":
-            raise ValueError("'search' parameter must not be empty")
-        if len(search) > 128:
-            raise ValueError(
-                "'search' parameter must be less than or equal to 128 characters"
-            )
+        c.check_length(search, "search")
         params = {
             c.ATTR_SOURCE_ID: source_id,
             c.ATTR_SEARCH: search,
             c.ATTR_SEARCH_CRITERIA_ID: criteria_id,
         }
-        if isinstance(range_start, int) and isinstance(range_end, int):
-            params[c.ATTR_RANGE] = f"{range_start},{range_end}"
+        if range_start is not None and range_end is not None:
+            params[c.ATTR_RANGE] = c.format_range(range_start, range_end)
         result = await self._connection.command(
             HeosCommand(c.COMMAND_BROWSE_SEARCH, params)
         )
@@ -349,7 +544,7 @@ class BrowseCommands(ConnectionMixin):
             c.ATTR_PLAYER_ID: player_id,
             c.ATTR_SOURCE_ID: source_id,
             c.ATTR_CONTAINER_ID: container_id,
-            c.ATTR_ADD_CRITERIA_ID: add_criteria,
+            c.ATTR_ADD_CRITERIA_ID: int(add_criteria),
         }
         if media_id is not None:
             params[c.ATTR_MEDIA_ID] = media_id
@@ -380,7 +575,7 @@ class BrowseCommands(ConnectionMixin):
         await self.add_to_queue(
             player_id=player_id,
             source_id=source_id,
-            container_id=f"{criteria_container_id}{search}",
+            container_id=criteria_container_id + search,
             add_criteria=add_criteria,
         )
 
@@ -393,12 +588,7 @@ class BrowseCommands(ConnectionMixin):
         References:
             4.4.14 Rename HEOS Playlist
         """
-        if new_name == "":
-            raise ValueError("'new_name' parameter must not be empty")
-        if len(new_name) > 128:
-            raise ValueError(
-                "'new_name' parameter must be less than or equal to 128 characters"
-            )
+        c.check_length(new_name, "new_name")
         await self._connection.command(
             HeosCommand(
                 c.COMMAND_BROWSE_RENAME_PLAYLIST,
@@ -409,6 +599,7 @@ class BrowseCommands(ConnectionMixin):
                 },
             )
         )
+        self._clear_browse_cache(source_id)
 
     async def delete_playlist(self, source_id: int, container_id: str) -> None:
         """
@@ -426,9 +617,10 @@ class BrowseCommands(ConnectionMixin):
                 },
             )
         )
+        self._clear_browse_cache(source_id)
 
     async def retrieve_metadata(
-        self, source_it: int, container_id: str
+        self, source_id: int, container_id: str
     ) -> RetreiveMetadataResult:
         """
         Create a HEOS command to retrieve metadata. Only supported by Rhapsody/Napster music sources.
@@ -436,11 +628,11 @@ class BrowseCommands(ConnectionMixin):
         References:
             4.4.17 Retrieve Metadata
         """
-        result = await self._connection.command(
+        result = await self._coalesced_command(
             HeosCommand(
                 c.COMMAND_BROWSE_RETRIEVE_METADATA,
                 {
-                    c.ATTR_SOURCE_ID: source_it,
+                    c.ATTR_SOURCE_ID: source_id,
                     c.ATTR_CONTAINER_ID: container_id,
                 },
             )
@@ -465,97 +657,23 @@ class BrowseCommands(ConnectionMixin):
         References:
             4.4.19 Set Service Option
         """
+        spec = _SERVICE_OPTION_SPECS.get(option_id)
+        if spec is None:
+            raise ValueError(f"Unknown option_id: {option_id}")
+
+        provided = (
+            (_SOURCE_ID_BIT if source_id is not None else 0)
+            | (_CONTAINER_ID_BIT if container_id is not None else 0)
+            | (_MEDIA_ID_BIT if media_id is not None else 0)
+            | (_PLAYER_ID_BIT if player_id is not None else 0)
+            | (_NAME_BIT if name is not None else 0)
+            | (_CRITERIA_ID_BIT if criteria_id is not None else 0)
+            | (_RANGE_START_BIT if range_start is not None else 0)
+            | (_RANGE_END_BIT if range_end is not None else 0)
+        )
         params: dict[str, Any] = {c.ATTR_OPTION_ID: option_id}
-        disallowed_params = {}
 
-        if option_id in (
-            SERVICE_OPTION_ADD_TRACK_TO_LIBRARY,
-            SERVICE_OPTION_ADD_STATION_TO_LIBRARY,
-            SERVICE_OPTION_REMOVE_TRACK_FROM_LIBRARY,
-            SERVICE_OPTION_REMOVE_STATION_FROM_LIBRARY,
-        ):
-            if source_id is None or media_id is None:
-                raise ValueError(
-                    f"source_id and media_id parameters are required for service option_id {option_id}"
-                )
-            disallowed_params = {
-                "container_id": container_id,
-                "player_id": player_id,
-                "name": name,
-                "criteria_id": criteria_id,
-                "range_start": range_start,
-                "range_end": range_end,
-            }
-            params[c.ATTR_SOURCE_ID] = source_id
-            params[c.ATTR_MEDIA_ID] = media_id
-        elif option_id in (
-            SERVICE_OPTION_ADD_ALBUM_TO_LIBRARY,
-            SERVICE_OPTION_REMOVE_ALBUM_FROM_LIBRARY,
-            SERVICE_OPTION_REMOVE_PLAYLIST_FROM_LIBRARY,
-        ):
-            if source_id is None or container_id is None:
-                raise ValueError(
-                    f"source_id and container_id parameters are required for service option_id {option_id}"
-                )
-            disallowed_params = {
-                "media_id": media_id,
-                "player_id": player_id,
-                "name": name,
-                "criteria_id": criteria_id,
-                "range_start": range_start,
-                "range_end": range_end,
-            }
-            params[c.ATTR_SOURCE_ID] = source_id
-            params[c.ATTR_CONTAINER_ID] = container_id
-        elif option_id == SERVICE_OPTION_ADD_PLAYLIST_TO_LIBRARY:
-            if source_id is None or container_id is None or name is None:
-                raise ValueError(
-                    f"source_id, container_id, and name parameters are required for service option_id {option_id}"
-                )
-            disallowed_params = {
-                "media_id": media_id,
-                "player_id": player_id,
-                "criteria_id": criteria_id,
-                "range_start": range_start,
-                "range_end": range_end,
-            }
-            params[c.ATTR_SOURCE_ID] = source_id
-            params[c.ATTR_CONTAINER_ID] = container_id
-            params[c.ATTR_NAME] = name
-        elif option_id in (
-            SERVICE_OPTION_THUMBS_UP,
-            SERVICE_OPTION_THUMBS_DOWN,
-        ):
-            if source_id is None or player_id is None:
-                raise ValueError(
-                    f"source_id and player_id parameters are required for service option_id {option_id}"
-                )
-            disallowed_params = {
-                "media_id": media_id,
-                "container_id": container_id,
-                "name": name,
-                "criteria_id": criteria_id,
-                "range_start": range_start,
-                "range_end": range_end,
-            }
-            params[c.ATTR_SOURCE_ID] = source_id
-            params[c.ATTR_PLAYER_ID] = player_id
-        elif option_id == SERVICE_OPTION_CREATE_NEW_STATION_BY_SEARCH_CRITERIA:
-            if source_id is None or name is None or criteria_id is None:
-                raise ValueError(
-                    f"source_id, name, and criteria_id parameters are required for service option_id {option_id}"
-                )
-            disallowed_params = {
-                "media_id": media_id,
-                "container_id": container_id,
-                "player_id": player_id,
-            }
-            params[c.ATTR_SOURCE_ID] = source_id
-            params[c.ATTR_SEARCH_CRITERIA_ID] = criteria_id
-            params[c.ATTR_NAME] = name
-            if isinstance(range_start, int) and isinstance(range_end, int):
-                params[c.ATTR_RANGE] = f"{range_start},{range_end}"
-        elif option_id == SERVICE_OPTION_ADD_TO_FAVORITES:
+        if option_id == SERVICE_OPTION_ADD_TO_FAVORITES:
             if not bool(player_id) ^ (
                 source_id is not None and media_id is not None and name is not None
             ):
@@ -572,40 +690,50 @@ class BrowseCommands(ConnectionMixin):
                 params[c.ATTR_SOURCE_ID] = source_id
                 params[c.ATTR_MEDIA_ID] = media_id
                 params[c.ATTR_NAME] = name
-            disallowed_params = {
-                "container_id": container_id,
-                "criteria_id": criteria_id,
-                "range_start": range_start,
-                "range_end": range_end,
-            }
-        elif option_id == SERVICE_OPTION_REMOVE_FROM_FAVORITES:
-            if media_id is None:
+        else:
+            if spec.required_mask & ~provided:
                 raise ValueError(
-                    f"media_id parameter is required for service option_id {option_id}"
+                    f"{spec.required_text} required for service option_id {option_id}"
                 )
-            params[c.ATTR_MEDIA_ID] = media_id
-            disallowed_params = {
-                "source_id": source_id,
-                "player_id": player_id,
-                "container_id": container_id,
-                "name": name,
-                "criteria_id": criteria_id,
-                "range_start": range_start,
-                "range_end": range_end,
-            }
-        else:
-            raise ValueError(f"Unknown option_id: {option_id}")
+            required = spec.required_mask
+            if required & _SOURCE_ID_BIT:
+                params[c.ATTR_SOURCE_ID] = source_id
+            if required & _CONTAINER_ID_BIT:
+                params[c.ATTR_CONTAINER_ID] = container_id
+            if required & _MEDIA_ID_BIT:
+                params[c.ATTR_MEDIA_ID] = media_id
+            if required & _PLAYER_ID_BIT:
+                params[c.ATTR_PLAYER_ID] = player_id
+            if required & _NAME_BIT:
+                params[c.ATTR_NAME] = name
+            if required & _CRITERIA_ID_BIT:
+                params[c.ATTR_SEARCH_CRITERIA_ID] = criteria_id
+            if (
+                not spec.disallowed_mask & _RANGE_START_BIT
+                and range_start is not None
+                and range_end is not None
+            ):
+                params[c.ATTR_RANGE] = c.format_range(range_start, range_end)
 
         # Raise if any disallowed parameters are provided
-        if any(param is not None for param in disallowed_params.values()):
+        if provided & spec.disallowed_mask:
             raise ValueError(
-                f"{', '.join(disallowed_params.keys())} parameters are not allowed for service option_id {option_id}"
+                f"{', '.join(spec.disallowed)} parameters are not allowed for service option_id {option_id}"
             )
 
         await this._connection.command(
             HeosCommand(c.COMMAND_BROWSE_SET_SERVICE_OPTION, params)
         )
 
+        # Library and favorites changes are reflected when browsing
+        if option_id in (
+            SERVICE_OPTION_ADD_TO_FAVORITES,
+            SERVICE_OPTION_REMOVE_FROM_FAVORITES,
+        ):
+            this._clear_browse_cache(MUSIC_SOURCE_FAVORITES)
+        elif source_id is not None:
+            this._clear_browse_cache(source_id)
+
     async def play_media(
         self,
         player_id: int,
@@ -623,7 +751,7 @@ class BrowseCommands(ConnectionMixin):
         if not media.playable:
             raise ValueError(f"Media '{media}' is not playable")
 
-        if media.media_id in VALID_INPUTS:
+        if media.media_id in _VALID_INPUTS:
             await self.play_input_source(player_id, media.media_id, media.source_id)
         elif media.type == MediaType.STATION:
             if media.media_id is None:
@@ -656,35 +784,41 @@ class BrowseCommands(ConnectionMixin):
             A sequence of MediaItem instances representing the available input sources across all aux input sources.
         """
         result = await self.browse(MUSIC_SOURCE_AUX_INPUT)
-        input_sources: list[MediaItem] = []
-        for item in result.items:
-            source_browse_result = await item.browse()
-            input_sources.extend(source_browse_result.items)
-
-        return input_sources
+        source_browse_results = await asyncio.gather(
+            *[item.browse() for item in result.items]
+        )
+        return [
+            input_source
+            for source_browse_result in source_browse_results
+            for input_source in source_browse_result.items
+        ]
 
-    async def get_favorites(self) -> dict[int, MediaItem]:
+    async def get_favorites(self, refresh: bool = False) -> dict[int, MediaItem]:
         """
         Get available favorites.
 
         This will browse the favorites music source and return a dictionary of all available favorites.
 
+        Args:
+            refresh: Set to True to bypass the cached favorites. The default is False.
         Returns:
             A dictionary with keys representing the index (1-based) of the favorite and the value being the MediaItem instance.
         """
-        result = await self.browse(MUSIC_SOURCE_FAVORITES)
-        return {index + 1: source for index, source in enumerate(result.items)}
+        result = await self.browse(MUSIC_SOURCE_FAVORITES, refresh=refresh)
+        return dict(enumerate(result.items, start=1))
 
-    async def get_playlists(self) -> Sequence[MediaItem]:
+    async def get_playlists(self, refresh: bool = False) -> Sequence[MediaItem]:
         """
         Get available playlists.
 
         This will browse the playlists music source and return a list of all available playlists.
 
+        Args:
+            refresh: Set to True to bypass the cached playlists. The default is False.
         Returns:
-            A sequence of MediaItem instances representing the available playlists.
+            A tuple of MediaItem instances representing the available playlists.
         """
-        result = await self.browse(MUSIC_SOURCE_PLAYLISTS)
+        result = await self.browse(MUSIC_SOURCE_PLAYLISTS, refresh=refresh)
         return result.items
 
     async def multi_search(
@@ -699,16 +833,40 @@ class BrowseCommands(ConnectionMixin):
         References:
             4.4.20 Multi Search
         """
-        if len(search) > 128:
-            raise ValueError(
-                "'search' parameter must be less than or equal to 128 characters"
-            )
+        c.check_length(search, "search", allow_empty=True)
         params = {c.ATTR_SEARCH: search}
         if source_ids is not None:
-            params[c.ATTR_SOURCE_ID] = ",".join(map(str, source_ids))
+            params[c.ATTR_SOURCE_ID] = c.join_ids(source_ids)
         if criteria_ids is not None:
-            params[c.ATTR_SEARCH_CRITERIA_ID] = ",".join(map(str, criteria_ids))
+            params[c.ATTR_SEARCH_CRITERIA_ID] = c.join_ids(criteria_ids)
         result = await self._connection.command(
             HeosCommand(c.COMMAND_BROWSE_MULTI_SEARCH, params)
         )
         return MultiSearchResult._from_message(result, cast("Heos", self))
+
+    async def search_many(
+        self,
+        search: str,
+        source_ids: list[int] | None = None,
+        criteria_ids: list[int] | None = None,
+    ) -> dict[int, list[MediaItem]]:
+        """
+        Search multiple sources with a single multi-search command and group the results by source.
+
+        References:
+            4.4.20 Multi Search
+
+        Args:
+            search: The search string.
+            source_ids: The identifiers of the sources to search. If not provided, all sources are searched.
+            criteria_ids: The identifiers of the search criteria to use. If not provided, all criteria are used.
+        Returns:
+            A dictionary with keys representing the source_id and the value being the items found in that source.
+        """
+        result = await self.multi_search(search, source_ids, criteria_ids)
+        items_by_source: dict[int, list[MediaItem]] = {
+            source_id: [] for source_id in result.source_ids
+        }
+        for item in result.items:
+            items_by_source.setdefault(item.source_id, []).append(item)
+        return items_by_source
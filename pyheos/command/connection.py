@@ -1,9 +1,16 @@
 """Define the connection mixin module."""
 
+import asyncio
+from collections.abc import Callable
+from typing import Any, TypeVar, cast
+
 from pyheos.connection import AutoReconnectingConnection
+from pyheos.message import HeosCommand, HeosMessage
 from pyheos.options import HeosOptions
 from pyheos.types import ConnectionState
 
+TResult = TypeVar("TResult")
+
 
 class ConnectionMixin:
     "A mixin to provide access to the connection."
@@ -20,8 +27,91 @@ class ConnectionMixin:
             heart_beat=options.heart_beat,
             heart_beat_interval=options.heart_beat_interval,
         )
+        self._in_flight: dict[str, asyncio.Task[Any]] = {}
+        self._follow_ups: dict[str, asyncio.Task[Any]] = {}
+        self._in_flight_sent: set[str] = set()
 
     @property
     def connection_state(self) -> ConnectionState:
         """Get the state of the connection."""
         return self._connection.state
+
+    async def _coalesced_command(
+        self, command: HeosCommand, *, fresh: bool = False
+    ) -> HeosMessage:
+        """
+        Send a read-only command, sharing the response with concurrent callers of the same command.
+
+        Callers that are cancelled do not cancel the command for the other callers. Set fresh to True
+        when the response must be requested after the call; a command already in flight is then
+        followed by a single new command shared by all such callers.
+        """
+        return await self._coalesced_call(command, _message, fresh=fresh)
+
+    async def _coalesced_call(
+        self,
+        command: HeosCommand,
+        parse: Callable[[HeosMessage], TResult],
+        *,
+        fresh: bool = False,
+    ) -> TResult:
+        """
+        Send a read-only command, sharing the parsed response with concurrent callers of the same command.
+
+        The response is parsed once and the same result is returned to every caller. A command must
+        always be shared with the same parse function.
+        """
+        uri = command.uri
+        task = self._in_flight.get(uri)
+        # A command that has not been sent yet still satisfies a fresh request
+        if task is not None and fresh and uri in self._in_flight_sent:
+            follow_up = self._follow_ups.get(uri)
+            if follow_up is None:
+                follow_up = asyncio.create_task(
+                    self._follow_up_command(command, parse, task)
+                )
+                self._follow_ups[uri] = follow_up
+
+                def _on_follow_up_done(done: asyncio.Task[Any]) -> None:
+                    del self._follow_ups[uri]
+                    # Mark the exception retrieved in case all callers were cancelled
+                    if not done.cancelled():
+                        done.exception()
+
+                follow_up.add_done_callback(_on_follow_up_done)
+            return cast(TResult, await asyncio.shield(follow_up))
+        if task is None:
+            task = asyncio.create_task(self._send_coalesced(command, parse))
+            self._in_flight[uri] = task
+
+            def _on_done(done: asyncio.Task[Any]) -> None:
+                del self._in_flight[uri]
+                self._in_flight_sent.discard(uri)
+                # Mark the exception retrieved in case all callers were cancelled
+                if not done.cancelled():
+                    done.exception()
+
+            task.add_done_callback(_on_done)
+        return cast(TResult, await asyncio.shield(task))
+
+    async def _send_coalesced(
+        self, command: HeosCommand, parse: Callable[[HeosMessage], TResult]
+    ) -> TResult:
+        """Send a shared command, marking it as sent for fresh callers."""
+        self._in_flight_sent.add(command.uri)
+        return parse(await self._connection.command(command))
+
+    async def _follow_up_command(
+        self,
+        command: HeosCommand,
+        parse: Callable[[HeosMessage], TResult],
+        previous: asyncio.Task[Any],
+    ) -> TResult:
+        """Send the command again once the previous command has completed."""
+        await asyncio.wait([previous])
+        return await self._coalesced_call(command, parse)
+
+
+def _message(message: HeosMessage) -> HeosMessage:
+    """Return the response message unparsed."""
+    return message
@@ -6,7 +6,7 @@ This module creates HEOS group commands.
 
 import asyncio
 from collections.abc import Sequence
-from typing import TYPE_CHECKING, Any, cast
+from typing import TYPE_CHECKING, Any, Final, cast
 
 from pyheos import command as c
 from pyheos.command.connection import ConnectionMixin
@@ -17,6 +17,9 @@ from pyheos.message import HeosCommand
 if TYPE_CHECKING:
     from pyheos.heos import Heos
 
+# Commands without parameters are built once and reused
+_GET_GROUPS: Final = HeosCommand(c.COMMAND_GET_GROUPS)
+
 
 class GroupCommands(ConnectionMixin):
     """A mixin to provide access to the group commands."""
@@ -26,6 +29,8 @@ class GroupCommands(ConnectionMixin):
         super(GroupCommands, self).__init__(*args, **kwargs)
         self._groups: dict[int, HeosGroup] = {}
         self._groups_loaded = False
+        self._groups_load: asyncio.Task[None] | None = None
+        self._groups_reload = False
 
     @property
     def groups(self) -> dict[int, HeosGroup]:
@@ -38,23 +43,48 @@ class GroupCommands(ConnectionMixin):
         References:
             4.3.1 Get Groups"""
         if not self._groups_loaded or refresh:
-            groups = {}
-            result = await self._connection.command(HeosCommand(c.COMMAND_GET_GROUPS))
-            payload = cast(Sequence[dict], result.payload)
-            for data in payload:
-                group = HeosGroup._from_data(data, cast("Heos", self))
-                groups[group.group_id] = group
-            self._groups = groups
-            # Update all statuses
-            await asyncio.gather(
-                *[
-                    group.refresh(refresh_base_info=False)
-                    for group in self._groups.values()
-                ]
-            )
-            self._groups_loaded = True
+            # Concurrent callers share a single load
+            task = self._groups_load
+            if task is None:
+                task = self._groups_load = asyncio.create_task(self._load_groups())
+                task.add_done_callback(self._on_groups_loaded)
+            elif refresh:
+                # The load in flight may have fetched the groups before this refresh was
+                # requested, so it loads once more before completing
+                self._groups_reload = True
+            await asyncio.shield(task)
         return self._groups
 
+    async def _load_groups(self) -> None:
+        """Load the groups, repeating once if a refresh was requested during the load."""
+        while True:
+            self._groups_reload = False
+            await self._load_groups_once()
+            if not self._groups_reload:
+                return
+
+    async def _load_groups_once(self) -> None:
+        """Load the groups and their statuses."""
+        result = await self._connection.command(_GET_GROUPS)
+        heos = cast("Heos", self)
+        groups = (
+            HeosGroup._from_data(data, heos)
+            for data in cast(Sequence[dict], result.payload)
+        )
+        self._groups = {group.group_id: group for group in groups}
+        # Update all statuses
+        await asyncio.gather(
+            *[group.refresh(refresh_base_info=False) for group in self._groups.values()]
+        )
+        self._groups_loaded = True
+
+    def _on_groups_loaded(self, task: asyncio.Task[None]) -> None:
+        """Release the shared load once it completes."""
+        self._groups_load = None
+        # Mark the exception retrieved in case all callers were cancelled
+        if not task.cancelled():
+            task.exception()
+
     async def get_group_info(
         self,
         group_id: int | None = None,
@@ -106,10 +136,12 @@ class GroupCommands(ConnectionMixin):
 
         References:
             4.3.3 Set Group"""
+        if not player_ids:
+            raise ValueError("'player_ids' parameter must not be empty")
         await self._connection.command(
             HeosCommand(
                 c.COMMAND_SET_GROUP,
-                {c.ATTR_PLAYER_ID: ",".join(map(str, player_ids))},
+                {c.ATTR_PLAYER_ID: c.join_ids(player_ids)},
             )
         )
 
@@ -167,8 +199,7 @@ class GroupCommands(ConnectionMixin):
 
         References:
             4.3.5 Set Group Volume"""
-        if level < 0 or level > 100:
-            raise ValueError("'level' must be in the range 0-100")
+        c.check_range(level, 0, 100, "level")
         await self._connection.command(
             HeosCommand(
                 c.COMMAND_SET_GROUP_VOLUME,
@@ -181,8 +212,7 @@ class GroupCommands(ConnectionMixin):
 
         References:
             4.3.6 Group Volume Up"""
-        if step < 1 or step > 10:
-            raise ValueError("'step' must be in the range 1-10")
+        c.check_range(step, 1, 10, "step")
         await self._connection.command(
             HeosCommand(
                 c.COMMAND_GROUP_VOLUME_UP,
@@ -195,8 +225,7 @@ class GroupCommands(ConnectionMixin):
 
         References:
             4.2.7 Group Volume Down"""
-        if step < 1 or step > 10:
-            raise ValueError("'step' must be in the range 1-10")
+        c.check_range(step, 1, 10, "step")
         await self._connection.command(
             HeosCommand(
                 c.COMMAND_GROUP_VOLUME_DOWN,
@@ -224,7 +253,7 @@ class GroupCommands(ConnectionMixin):
                 c.COMMAND_SET_GROUP_MUTE,
                 {
                     c.ATTR_GROUP_ID: group_id,
-                    c.ATTR_STATE: c.VALUE_ON if state else c.VALUE_OFF,
+                    c.ATTR_STATE: c.VALUE_OFF_ON[bool(state)],
                 },
             )
         )
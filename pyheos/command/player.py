@@ -5,14 +5,16 @@ This module creates HEOS player commands.
 """
 
 import asyncio
+import logging
 from collections.abc import Sequence
-from typing import TYPE_CHECKING, Any, cast
+from typing import TYPE_CHECKING, Any, Final, cast
 
 from pyheos import command as c
 from pyheos import const
 from pyheos.command.connection import ConnectionMixin
+from pyheos.error import HeosError
 from pyheos.media import QueueItem
-from pyheos.message import HeosCommand
+from pyheos.message import GET_PLAYERS_COMMAND, HeosCommand
 from pyheos.player import (
     HeosNowPlayingMedia,
     HeosPlayer,
@@ -25,6 +27,8 @@ from pyheos.types import RepeatType
 if TYPE_CHECKING:
     from pyheos.heos import Heos
 
+_LOGGER: Final = logging.getLogger(__name__)
+
 
 class PlayerCommands(ConnectionMixin):
     """A mixin to provide access to the player commands."""
@@ -63,9 +67,10 @@ class PlayerCommands(ConnectionMixin):
         Only one of player_id or player should be provided.
 
         Args:
-            palyer_id: The identifier of the group to get information about. Only one of player_id or player should be provided.
+            player_id: The identifier of the player to get information about. Only one of player_id or player should be provided.
             player: The HeosPlayer instance to update with the latest information. Only one of player_id or player should be provided.
-            refresh: Set to True to force a refresh of the group information.
+            refresh: Set to True to force a refresh of the player information. A player that is already loaded is returned without sending commands otherwise.
+
         Returns:
             A HeosPlayer instance containing the player information.
 
@@ -76,7 +81,7 @@ class PlayerCommands(ConnectionMixin):
         if player_id is not None and player is not None:
             raise ValueError("Only one of player_id or player should be provided")
 
-        # if only palyer_id provided, try getting from loaded
+        # if only player_id provided, try getting from loaded
         if player is None:
             assert player_id is not None
             player = self._players.get(player_id)
@@ -94,6 +99,7 @@ class PlayerCommands(ConnectionMixin):
                 player = HeosPlayer._from_data(payload, cast("Heos", self))
             else:
                 player._update_from_data(payload)
+            # The state is pulled after the info as the player id may have changed
             await player.refresh(refresh_base_info=False)
         return player
 
@@ -102,9 +108,20 @@ class PlayerCommands(ConnectionMixin):
         result = PlayerUpdateResult()
 
         players: dict[int, HeosPlayer] = {}
-        response = await self._connection.command(HeosCommand(c.COMMAND_GET_PLAYERS))
+        response = await self._connection.command(GET_PLAYERS_COMMAND)
         payload = cast(Sequence[dict], response.payload)
-        existing = list(self._players.values())
+        existing = dict(self._players)
+        # Index the existing players once so each incoming player is a dict lookup
+        existing_by_serial = {
+            player.serial: player
+            for player in existing.values()
+            if player.serial is not None
+        }
+        existing_by_name: dict[str, list[HeosPlayer]] = {}
+        for existing_player in existing.values():
+            existing_by_name.setdefault(existing_player.name, []).append(
+                existing_player
+            )
         for player_data in payload:
             player_id = int(player_data[c.ATTR_PLAYER_ID])
             name = player_data[c.ATTR_NAME]
@@ -112,43 +129,58 @@ class PlayerCommands(ConnectionMixin):
             serial = player_data.get(c.ATTR_SERIAL)
             # Try matching by serial (if available), then try matching by player_id
             # and fallback to matching name when firmware version is different
-            player = next(
-                (
-                    player
-                    for player in existing
-                    if (player.serial == serial and serial is not None)
-                    or player.player_id == player_id
-                    or (player.name == name and player.version != version)
-                ),
-                None,
-            )
+            player = existing_by_serial.get(serial) if serial is not None else None
+            if player is None:
+                player = existing.get(player_id)
+            if player is None:
+                player = next(
+                    (
+                        candidate
+                        for candidate in existing_by_name.get(name, ())
+                        if candidate.version != version
+                    ),
+                    None,
+                )
             if player:
                 # Found existing, update
                 if player.player_id != player_id:
                     result.updated_player_ids[player.player_id] = player_id
+                # Remove from the indexes before the keys are updated
+                del existing[player.player_id]
+                if (
+                    player.serial is not None
+                    and existing_by_serial.get(player.serial) is player
+                ):
+                    del existing_by_serial[player.serial]
+                existing_by_name[player.name].remove(player)
                 player._update_from_data(player_data)
                 player.available = True
                 players[player_id] = player
-                existing.remove(player)
             else:
                 # New player
                 player = HeosPlayer._from_data(player_data, cast("Heos", self))
                 result.added_player_ids.append(player_id)
                 players[player_id] = player
         # For any item remaining in existing, mark unavailalbe, add to updated
-        for player in existing:
+        for player in existing.values():
             result.removed_player_ids.append(player.player_id)
             player.available = False
             players[player.player_id] = player
 
-        # Pull data for available players
-        await asyncio.gather(
-            *[
-                player.refresh(refresh_base_info=False)
-                for player in players.values()
-                if player.available
-            ]
+        # Pull data for available players. A player that fails to refresh keeps its
+        # last known state so the others are not lost.
+        available = [player for player in players.values() if player.available]
+        results = await asyncio.gather(
+            *[player.refresh(refresh_base_info=False) for player in available],
+            return_exceptions=True,
         )
+        for player, error in zip(available, results):
+            if isinstance(error, HeosError):
+                _LOGGER.warning(
+                    "Unable to refresh player %s: %s", player.player_id, error
+                )
+            elif isinstance(error, BaseException):
+                raise error
         self._players = players
         self._players_loaded = True
         return result
@@ -211,8 +243,7 @@ class PlayerCommands(ConnectionMixin):
 
         References:
             4.2.7 Set Volume"""
-        if level < 0 or level > 100:
-            raise ValueError("'level' must be in the range 0-100")
+        c.check_range(level, 0, 100, "level")
         await self._connection.command(
             HeosCommand(
                 c.COMMAND_SET_VOLUME,
@@ -227,8 +258,7 @@ class PlayerCommands(ConnectionMixin):
 
         References:
             4.2.8 Volume Up"""
-        if step < 1 or step > 10:
-            raise ValueError("'step' must be in the range 1-10")
+        c.check_range(step, 1, 10, "step")
         await self._connection.command(
             HeosCommand(
                 c.COMMAND_VOLUME_UP,
@@ -243,8 +273,7 @@ class PlayerCommands(ConnectionMixin):
 
         References:
             4.2.9 Volume Down"""
-        if step < 1 or step > 10:
-            raise ValueError("'step' must be in the range 1-10")
+        c.check_range(step, 1, 10, "step")
         await self._connection.command(
             HeosCommand(
                 c.COMMAND_VOLUME_DOWN,
@@ -272,7 +301,7 @@ class PlayerCommands(ConnectionMixin):
                 c.COMMAND_SET_MUTE,
                 {
                     c.ATTR_PLAYER_ID: player_id,
-                    c.ATTR_STATE: c.VALUE_ON if state else c.VALUE_OFF,
+                    c.ATTR_STATE: c.VALUE_OFF_ON[bool(state)],
                 },
             )
         )
@@ -309,7 +338,7 @@ class PlayerCommands(ConnectionMixin):
                 {
                     c.ATTR_PLAYER_ID: player_id,
                     c.ATTR_REPEAT: repeat,
-                    c.ATTR_SHUFFLE: c.VALUE_ON if shuffle else c.VALUE_OFF,
+                    c.ATTR_SHUFFLE: c.VALUE_OFF_ON[bool(shuffle)],
                 },
             )
         )
@@ -326,13 +355,13 @@ class PlayerCommands(ConnectionMixin):
             4.2.15 Get Queue
         """
         params: dict[str, Any] = {c.ATTR_PLAYER_ID: player_id}
-        if isinstance(range_start, int) and isinstance(range_end, int):
-            params[c.ATTR_RANGE] = f"{range_start},{range_end}"
+        if range_start is not None and range_end is not None:
+            params[c.ATTR_RANGE] = c.format_range(range_start, range_end)
         result = await self._connection.command(
             HeosCommand(c.COMMAND_GET_QUEUE, params)
         )
         payload = cast(list[dict[str, str]], result.payload)
-        return [QueueItem.from_data(data) for data in payload]
+        return list(map(QueueItem.from_data, payload))
 
     async def player_play_queue(self, player_id: int, queue_id: int) -> None:
         """Play a queue item.
@@ -353,12 +382,14 @@ class PlayerCommands(ConnectionMixin):
 
         References:
             4.2.17 Remove Item(s) from Queue"""
+        if not queue_ids:
+            raise ValueError("'queue_ids' parameter must not be empty")
         await self._connection.command(
             HeosCommand(
                 c.COMMAND_REMOVE_FROM_QUEUE,
                 {
                     c.ATTR_PLAYER_ID: player_id,
-                    c.ATTR_QUEUE_ID: ",".join(map(str, queue_ids)),
+                    c.ATTR_QUEUE_ID: c.join_ids(queue_ids),
                 },
             )
         )
@@ -376,6 +407,8 @@ class PlayerCommands(ConnectionMixin):
                 {c.ATTR_PLAYER_ID: player_id, c.ATTR_NAME: name},
             )
         )
+        # The new playlist is reflected when browsing playlists
+        cast("Heos", self)._clear_browse_cache(const.MUSIC_SOURCE_PLAYLISTS)
 
     async def player_clear_queue(self, player_id: int) -> None:
         """Clear the queue.
@@ -393,12 +426,14 @@ class PlayerCommands(ConnectionMixin):
 
         References:
             4.2.20 Move Queue"""
+        if not source_queue_ids:
+            raise ValueError("'source_queue_ids' parameter must not be empty")
         await self._connection.command(
             HeosCommand(
                 c.COMMAND_MOVE_QUEUE_ITEM,
                 {
                     c.ATTR_PLAYER_ID: player_id,
-                    c.ATTR_SOURCE_QUEUE_ID: ",".join(map(str, source_queue_ids)),
+                    c.ATTR_SOURCE_QUEUE_ID: c.join_ids(source_queue_ids),
                     c.ATTR_DESTINATION_QUEUE_ID: destination_queue_id,
                 },
             )
@@ -429,8 +464,7 @@ class PlayerCommands(ConnectionMixin):
 
         References:
             4.2.23 Set QuickSelect"""
-        if quick_select_id < 1 or quick_select_id > 6:
-            raise ValueError("'quick_select_id' must be in the range 1-6")
+        c.check_range(quick_select_id, 1, 6, "quick_select_id")
         await self._connection.command(
             HeosCommand(
                 c.COMMAND_SET_QUICK_SELECT,
@@ -445,8 +479,7 @@ class PlayerCommands(ConnectionMixin):
 
         References:
             4.2.24 Play QuickSelect"""
-        if quick_select_id < 1 or quick_select_id > 6:
-            raise ValueError("'quick_select_id' must be in the range 1-6")
+        c.check_range(quick_select_id, 1, 6, "quick_select_id")
         await self._connection.command(
             HeosCommand(
                 c.COMMAND_PLAY_QUICK_SELECT,
@@ -480,5 +513,5 @@ class PlayerCommands(ConnectionMixin):
         result = await self._connection.command(
             HeosCommand(c.COMMAND_CHECK_UPDATE, {c.ATTR_PLAYER_ID: player_id})
         )
-        payload = cast(dict[str, Any], result.payload)
-        return bool(payload[c.ATTR_UPDATE] == c.VALUE_UPDATE_EXIST)
+        payload = cast(dict[str, str], result.payload)
+        return payload[c.ATTR_UPDATE] == c.VALUE_UPDATE_EXIST
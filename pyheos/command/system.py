@@ -10,14 +10,20 @@ Commands not implemented:
 """
 
 from collections.abc import Sequence
-from typing import Any, cast
+from typing import Any, Final, cast
 
 from pyheos import command as c
 from pyheos.command.connection import ConnectionMixin
 from pyheos.credentials import Credentials
-from pyheos.message import HeosCommand
+from pyheos.error import HeosError
+from pyheos.message import GET_PLAYERS_COMMAND, HEART_BEAT_COMMAND, HeosCommand
 from pyheos.system import HeosHost, HeosSystem
 
+# Commands without parameters are built once and reused
+_ACCOUNT_CHECK: Final = HeosCommand(c.COMMAND_ACCOUNT_CHECK)
+_SIGN_OUT: Final = HeosCommand(c.COMMAND_SIGN_OUT)
+_REBOOT: Final = HeosCommand(c.COMMAND_REBOOT)
+
 
 class SystemCommands(ConnectionMixin):
     """A mixin to provide access to the system commands."""
@@ -57,7 +63,7 @@ class SystemCommands(ConnectionMixin):
         await self._connection.command(
             HeosCommand(
                 c.COMMAND_REGISTER_FOR_CHANGE_EVENTS,
-                {c.ATTR_ENABLE: c.VALUE_ON if enable else c.VALUE_OFF},
+                {c.ATTR_ENABLE: c.VALUE_OFF_ON[bool(enable)]},
             )
         )
 
@@ -66,7 +72,7 @@ class SystemCommands(ConnectionMixin):
 
         References:
             4.1.2 HEOS Account Check"""
-        result = await self._connection.command(HeosCommand(c.COMMAND_ACCOUNT_CHECK))
+        result = await self._connection.command(_ACCOUNT_CHECK)
         if c.ATTR_SIGNED_IN in result.message:
             self._signed_in_username = result.get_message_value(c.ATTR_USER_NAME)
         else:
@@ -107,7 +113,7 @@ class SystemCommands(ConnectionMixin):
 
         References:
             4.1.4 HEOS Account Sign Out"""
-        await self._connection.command(HeosCommand(c.COMMAND_SIGN_OUT))
+        await self._connection.command(_SIGN_OUT)
         self._signed_in_username = None
         if update_credential:
             self.current_credentials = None
@@ -117,22 +123,29 @@ class SystemCommands(ConnectionMixin):
 
         References:
             4.1.5 HEOS System Heart Beat"""
-        await self._connection.command(HeosCommand(c.COMMAND_HEART_BEAT))
+        await self._connection.command(HEART_BEAT_COMMAND)
 
     async def reboot(self) -> None:
         """Reboot the HEOS device.
 
         References:
             4.1.6 HEOS Speaker Reboot"""
-        await self._connection.command(HeosCommand(c.COMMAND_REBOOT))
+        await self._connection.command(_REBOOT)
 
     async def get_system_info(self) -> HeosSystem:
         """Get information about the HEOS system.
 
         References:
             4.2.1 Get Players"""
-        response = await self._connection.command(HeosCommand(c.COMMAND_GET_PLAYERS))
+        response = await self._connection.command(GET_PLAYERS_COMMAND)
         payload = cast(Sequence[dict], response.payload)
-        hosts = list([HeosHost._from_data(item) for item in payload])
-        host = next(host for host in hosts if host.ip_address == self._options.host)
+        hosts: list[HeosHost] = []
+        host: HeosHost | None = None
+        for item in payload:
+            item_host = HeosHost._from_data(item)
+            hosts.append(item_host)
+            if item_host.ip_address == self._options.host:
+                host = item_host
+        if host is None:
+            raise HeosError("Connected host not found in the system")
         return HeosSystem(self._signed_in_username, host, hosts)
@@ -2,12 +2,15 @@
 
 import asyncio
 import logging
+import random
+import socket
+import time
+from collections import deque
 from collections.abc import Awaitable, Callable, Coroutine
-from datetime import datetime, timedelta
 from typing import TYPE_CHECKING, Final
 
-from pyheos.command import COMMAND_HEART_BEAT, COMMAND_REBOOT
-from pyheos.message import HeosCommand, HeosMessage
+from pyheos.command import COMMAND_REBOOT
+from pyheos.message import HEART_BEAT_COMMAND, HeosCommand, HeosMessage
 from pyheos.types import ConnectionState
 
 from .error import CommandError, CommandFailedError, HeosError
@@ -16,6 +19,7 @@ CLI_PORT: Final = 1255
 SEPARATOR: Final = "\r\n"
 SEPARATOR_BYTES: Final = SEPARATOR.encode()
 MAX_RECONNECT_DELAY = 600
+RECONNECT_JITTER: Final = 0.2
 
 _LOGGER: Final = logging.getLogger(__name__)
 
@@ -33,9 +37,11 @@ class ConnectionBase:
         self._timeout: float = timeout
         self._state: ConnectionState = ConnectionState.DISCONNECTED
         self._writer: asyncio.StreamWriter | None = None
-        self._pending_command_event = ResponseEvent()
+        self._pending_command: asyncio.Future[HeosMessage] | None = None
+        self._event_queue: deque[HeosMessage] = deque()
+        self._event_task: asyncio.Task | None = None
         self._running_tasks: set[asyncio.Task] = set()
-        self._last_activity: datetime = datetime.now()
+        self._last_activity: float = time.monotonic()
         self._command_lock = asyncio.Lock()
 
         self._on_event_callbacks: list[Callable[[HeosMessage], Awaitable]] = []
@@ -59,6 +65,16 @@ class ConnectionBase:
         for callback in self._on_event_callbacks:
             await callback(message)
 
+    async def _event_handler(self) -> None:
+        """Process queued events in order until the queue is empty."""
+        while self._event_queue:
+            message = self._event_queue.popleft()
+            try:
+                await self._on_event(message)
+            except Exception:
+                _LOGGER.exception("Unhandled error processing event: %s", message)
+        self._event_task = None
+
     def add_on_connected(self, callback: Callable[[], Awaitable]) -> None:
         """Add a callback to be invoked when connected."""
         self._on_connected_callbacks.append(callback)
@@ -88,11 +104,12 @@ class ConnectionBase:
         for callback in self._on_command_error_callbacks:
             await callback(error)
 
-    def _register_task(self, future: Coroutine) -> None:
+    def _register_task(self, future: Coroutine) -> asyncio.Task:
         """Register a task that is running in the background, so it can be canceled and reset later."""
         task = asyncio.ensure_future(future)
         self._running_tasks.add(task)
         task.add_done_callback(self._running_tasks.discard)
+        return task
 
     async def _reset(self) -> None:
         """Reset the state of the connection."""
@@ -113,9 +130,15 @@ class ConnectionBase:
                 pass
             finally:
                 self._writer = None
-        # Reset other parameters
-        self._pending_command_event.clear()
-        self._last_activity = datetime.now()
+        # Reset other parameters, failing any command still waiting for a response
+        if self._pending_command is not None and not self._pending_command.done():
+            self._pending_command.set_exception(
+                ConnectionResetError("Connection reset")
+            )
+        self._pending_command = None
+        self._event_queue.clear()
+        self._event_task = None
+        self._last_activity = time.monotonic()
         self._state = ConnectionState.DISCONNECTED
 
     async def _disconnect_from_error(self, error: Exception) -> None:
@@ -143,7 +166,7 @@ class ConnectionBase:
                 await self._disconnect_from_error(error)
                 return
             else:
-                self._last_activity = datetime.now()
+                self._last_activity = time.monotonic()
                 await self._handle_message(
                     HeosMessage._from_raw_message(binary_result.decode())
                 )
@@ -155,11 +178,17 @@ class ConnectionBase:
             return
         if message.is_event:
             _LOGGER.debug("Event received: '%s': '%s'", message.command, message)
-            self._register_task(self._on_event(message))
+            # Events are handled in order by a single task that runs while events are queued
+            self._event_queue.append(message)
+            if self._event_task is None:
+                self._event_task = self._register_task(self._event_handler())
             return
 
         # Set the message on the pending command.
-        self._pending_command_event.set(message)
+        if self._pending_command is None or self._pending_command.done():
+            _LOGGER.debug("Response received with no pending command: '%s'", message)
+            return
+        self._pending_command.set_result(message)
 
     async def command(self, command: HeosCommand) -> HeosMessage:
         """Send a command to the HEOS device."""
@@ -172,39 +201,56 @@ class ConnectionBase:
                 raise CommandError(command.command, "Not connected to device")
             if TYPE_CHECKING:
                 assert self._writer is not None
-            assert not self._pending_command_event.is_set()
-            # Send the command
-            try:
-                self._writer.write((command.uri + SEPARATOR).encode())
-                await self._writer.drain()
-            except (ConnectionError, OSError, AttributeError) as error:
-                # Occurs when the connection is broken. Run in the background to ensure connection is reset.
-                self._register_task(self._disconnect_from_error(error))
-                _LOGGER.debug(
-                    "Command failed '%s': %s: %s", command, type(error).__name__, error
-                )
-                raise CommandError(
-                    command.command, f"Command failed: {error}"
-                ) from error
-            else:
-                self._last_activity = datetime.now()
-
-            # If the command is a reboot, we won't get a response.
-            if command.command == COMMAND_REBOOT:
-                _LOGGER.debug("Command executed '%s': No response", command)
-                return HeosMessage(COMMAND_REBOOT)
-
-            # Wait for the response with a timeout
+            assert self._pending_command is None
+            # Register for the response before sending, as it may arrive while draining
+            response_future: asyncio.Future[HeosMessage] = (
+                asyncio.get_running_loop().create_future()
+            )
+            self._pending_command = response_future
             try:
-                response = await asyncio.wait_for(
-                    self._pending_command_event.wait(), self._timeout
-                )
-            except asyncio.TimeoutError as error:
-                # Occurs when the command times out
-                _LOGGER.debug("Command timed out '%s'", command)
-                raise CommandError(command.command, "Command timed out") from error
+                # Send the command
+                try:
+                    self._writer.writelines((command.uri_bytes, SEPARATOR_BYTES))
+                    await self._writer.drain()
+                except (ConnectionError, OSError, AttributeError) as error:
+                    # Occurs when the connection is broken. Run in the background to ensure connection is reset.
+                    self._register_task(self._disconnect_from_error(error))
+                    _LOGGER.debug(
+                        "Command failed '%s': %s: %s",
+                        command,
+                        type(error).__name__,
+                        error,
+                    )
+                    raise CommandError(
+                        command.command, f"Command failed: {error}"
+                    ) from error
+                else:
+                    self._last_activity = time.monotonic()
+
+                # If the command is a reboot, we won't get a response.
+                if command.command == COMMAND_REBOOT:
+                    _LOGGER.debug("Command executed '%s': No response", command)
+                    return HeosMessage(COMMAND_REBOOT)
+
+                # Wait for the response with a timeout
+                try:
+                    response = await asyncio.wait_for(response_future, self._timeout)
+                except asyncio.TimeoutError as error:
+                    # Occurs when the command times out
+                    _LOGGER.debug("Command timed out '%s'", command)
+                    raise CommandError(command.command, "Command timed out") from error
+                except ConnectionResetError as error:
+                    # Occurs when the connection is reset while waiting
+                    _LOGGER.debug("Command failed '%s': Connection reset", command)
+                    raise CommandError(
+                        command.command, "Connection reset while waiting for response"
+                    ) from error
             finally:
-                self._pending_command_event.clear()
+                # Always release the pending response, including when the caller is cancelled
+                if self._pending_command is response_future:
+                    self._pending_command = None
+                if response_future.done() and not response_future.cancelled():
+                    response_future.exception()
 
             # The retrieved response should match the command
             assert command.command == response.command
@@ -236,7 +282,7 @@ class ConnectionBase:
             return
         # Open the connection to the host
         try:
-            reader, self._writer = await asyncio.wait_for(
+            reader, writer = await asyncio.wait_for(
                 asyncio.open_connection(self._host, CLI_PORT), self._timeout
             )
         except asyncio.TimeoutError as err:
@@ -250,9 +296,17 @@ class ConnectionBase:
                 f"Unable to connect to {self._host}: {type(err).__name__}: {err}"
             ) from err
 
+        # Commands are small request/response frames: send immediately and have
+        # drain wait until the data has been handed to the socket.
+        sock = writer.get_extra_info("socket")
+        if sock is not None:
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        writer.transport.set_write_buffer_limits(high=0)
+        self._writer = writer
+
         # Start read handler
         self._register_task(self._read_handler(reader))
-        self._last_activity = datetime.now()
+        self._last_activity = time.monotonic()
         self._state = ConnectionState.CONNECTED
         _LOGGER.debug("Connected to %s", self._host)
         await self._on_connected()
@@ -289,7 +343,6 @@ class AutoReconnectingConnection(ConnectionBase):
         self._reconnect_max_attempts = reconnect_max_attempts
         self._heart_beat = heart_beat
         self._heart_beat_interval = heart_beat_interval
-        self._heart_beat_interval_delta = timedelta(seconds=heart_beat_interval)
 
     async def _heart_beat_handler(self) -> None:
         """
@@ -299,10 +352,9 @@ class AutoReconnectingConnection(ConnectionBase):
         fails or times out, the existing command processing logic will reset the state of the connection.
         """
         while self._state == ConnectionState.CONNECTED:
-            last_acitvity_delta = datetime.now() - self._last_activity
-            if last_acitvity_delta >= self._heart_beat_interval_delta:
+            if time.monotonic() - self._last_activity >= self._heart_beat_interval:
                 try:
-                    await self.command(HeosCommand(COMMAND_HEART_BEAT))
+                    await self.command(HEART_BEAT_COMMAND)
                 except (CommandError, asyncio.TimeoutError):
                     # Exit the task, as the connection will be reset/closed.
                     return
@@ -317,10 +369,16 @@ class AutoReconnectingConnection(ConnectionBase):
         delay = min(self._reconnect_delay, MAX_RECONNECT_DELAY)
         while (attempts < self._reconnect_max_attempts) or unlimited_attempts:
             try:
+                # Jitter the delay so clients that lost the device together do not retry in lockstep
+                jittered_delay = min(
+                    delay * random.uniform(1 - RECONNECT_JITTER, 1 + RECONNECT_JITTER),
+                    MAX_RECONNECT_DELAY,
+                )
                 _LOGGER.debug(
-                    "Waiting %s seconds before attempting to reconnect", delay
+                    "Waiting %.2f seconds before attempting to reconnect",
+                    jittered_delay,
                 )
-                await asyncio.sleep(delay)
+                await asyncio.sleep(jittered_delay)
                 _LOGGER.debug(
                     "Attempting reconnect #%s to %s", (attempts + 1), self._host
                 )
@@ -343,33 +401,3 @@ class AutoReconnectingConnection(ConnectionBase):
         if due_to_error and self._reconnect:
             self._register_task(self._attempt_reconnect())
         await super()._on_disconnected(due_to_error)
-
-
-class ResponseEvent:
-    """Define an awaitable command event response."""
-
-    def __init__(self) -> None:
-        """Init a new instance of the CommandEvent."""
-        self._event: asyncio.Event = asyncio.Event()
-        self._response: HeosMessage | None = None
-
-    async def wait(self) -> HeosMessage:
-        """Wait until the event is set."""
-        await self._event.wait()
-        if TYPE_CHECKING:
-            assert self._response is not None
-        return self._response
-
-    def set(self, response: HeosMessage) -> None:
-        """Set the response."""
-        self._response = response
-        self._event.set()
-
-    def clear(self) -> None:
-        """Clear the event."""
-        self._response = None
-        self._event.clear()
-
-    def is_set(self) -> bool:
-        """Return True if the event is set."""
-        return self._event.is_set()
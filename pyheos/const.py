@@ -11,6 +11,7 @@ DEFAULT_RECONNECT_DELAY: Final = 10.0
 DEFAULT_RECONNECT_ATTEMPTS: Final = 0  # Unlimited
 DEFAULT_HEART_BEAT: Final = 10.0
 DEFAULT_STEP: Final = 5
+DEFAULT_BROWSE_CACHE_TTL: Final = 30.0
 
 # Command error codes (keep discrete values as we do not control the list)
 ERROR_UNREGONIZED_COMMAND: Final = 1
@@ -53,6 +53,7 @@ class Heos(SystemCommands, BrowseCommands, GroupCommands, PlayerCommands):
             heart_beat: Set to True to enable heart beat messages, False to disable. Used in conjunction with heart_beat_delay. The default is True.
             heart_beat_interval: The interval in seconds between heart beat messages. Used in conjunction with heart_beat.
             credentials: credentials to use to automatically sign-in to the HEOS account upon successful connection. If not provided, the account will not be signed in.
+            browse_cache_ttl: The time in seconds browse results are reused before they are requested again. The default is 30 seconds. Set to 0 to disable caching.
 
         """
         heos = Heos(HeosOptions(host, **kwargs))
@@ -226,9 +227,13 @@ class Heos(SystemCommands, BrowseCommands, GroupCommands, PlayerCommands):
         result: PlayerUpdateResult | None = None
         if event.command == const.EVENT_PLAYERS_CHANGED and self._players_loaded:
             result = await self.load_players()
-        if event.command == const.EVENT_SOURCES_CHANGED and self._music_sources_loaded:
-            await self.get_music_sources(refresh=True)
+        if event.command == const.EVENT_SOURCES_CHANGED:
+            self._clear_browse_cache()
+            self._search_criteria.clear()
+            if self._music_sources_loaded:
+                await self.get_music_sources(refresh=True)
         elif event.command == const.EVENT_USER_CHANGED:
+            self._clear_browse_cache()
             if c.ATTR_SIGNED_IN in event.message:
                 self._signed_in_username = event.get_message_value(c.ATTR_USER_NAME)
             else:
@@ -270,13 +270,11 @@ class BrowseResult:
             returned=message.get_message_value_int(c.ATTR_RETURNED),
             source_id=source_id,
             container_id=container_id,
-            items=list(
-                [
-                    MediaItem.from_data(item, source_id, container_id, heos)
-                    for item in cast(Sequence[dict], message.payload)
-                ]
+            items=tuple(
+                MediaItem.from_data(item, source_id, container_id, heos)
+                for item in cast(Sequence[dict], message.payload)
             ),
-            options=ServiceOption._from_options(message.options),
+            options=tuple(ServiceOption._from_options(message.options)),
             heos=heos,
         )
 
@@ -1,39 +1,68 @@
 """Define the message module for signals received from HEOS."""
 
 import json
+from collections.abc import Mapping
 from dataclasses import dataclass, field
 from functools import cached_property
-from typing import Any, Final
+from types import MappingProxyType
+from typing import Any, Final, cast
 from urllib.parse import parse_qsl
 
 from pyheos import command as c
 
 BASE_URI: Final = "heos://"
 QUOTE_MAP: Final = {"&": "%26", "=": "%3D", "%": "%25"}
+QUOTE_TABLE: Final = str.maketrans(QUOTE_MAP)
 MASKED_PARAMS: Final = {c.ATTR_PASSWORD}
 MASK: Final = "********"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class HeosCommand:
     """Define a HEOS command that is sent to the HEOS device."""
 
     command: str
-    parameters: dict[str, Any] = field(default_factory=dict)
+    parameters: Mapping[str, Any] = field(default_factory=dict)
+
+    # Lazily rendered URIs, cached on first use
+    _uri: str | None = field(default=None, init=False, repr=False, compare=False)
+    _uri_masked: str | None = field(default=None, init=False, repr=False, compare=False)
+    _uri_bytes: bytes | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        """Copy the parameters into a read-only mapping so the cached URI cannot go stale."""
+        object.__setattr__(self, "parameters", MappingProxyType(dict(self.parameters)))
 
     def __repr__(self) -> str:
         """Get a string representaton of the message."""
         return self.uri_masked
 
-    @cached_property
+    def __hash__(self) -> int:
+        """Get the hash of the command, based on its URI."""
+        return hash(self.uri)
+
+    @property
     def uri(self) -> str:
         """Get the command as a URI string that can be sent to the controller."""
-        return self._get_uri(False)
-
-    @cached_property
+        if self._uri is None:
+            object.__setattr__(self, "_uri", self._get_uri(False))
+        return cast(str, self._uri)
+
+    @property
+    def uri_bytes(self) -> bytes:
+        """Get the command as an encoded URI that can be written to the connection."""
+        if self._uri_bytes is None:
+            object.__setattr__(self, "_uri_bytes", self.uri.encode())
+        return cast(bytes, self._uri_bytes)
+
+    @property
     def uri_masked(self) -> str:
         """Get the command as a URI string that has sensitive fields masked."""
-        return self._get_uri(True)
+        if self._uri_masked is None:
+            object.__setattr__(self, "_uri_masked", self._get_uri(True))
+        return cast(str, self._uri_masked)
 
     def _get_uri(self, mask: bool = False) -> str:
         """Get the command as a URI string."""
@@ -47,23 +76,31 @@ class HeosCommand:
     @staticmethod
     def __quote(value: Any) -> str:
         """Quote a string per the CLI specification."""
-        return "".join([QUOTE_MAP.get(char, char) for char in str(value)])
+        return str(value).translate(QUOTE_TABLE)
 
     @staticmethod
-    def __encode_query(items: dict[str, Any], *, mask: bool = False) -> str:
+    def __encode_query(items: Mapping[str, Any], *, mask: bool = False) -> str:
         """Encode a dict to query string per CLI specifications."""
+        quote = HeosCommand.__quote
         pairs = []
-        for key in sorted(items.keys()):
+        url_pair: str | None = None
+        for key in sorted(items, reverse=True):
             value = MASK if mask and key in MASKED_PARAMS else items[key]
-            item = f"{key}={HeosCommand.__quote(value)}"
             # Ensure 'url' goes last per CLI spec and is not quoted
             if key == c.ATTR_URL:
-                pairs.append(f"{key}={value}")
+                url_pair = f"{key}={value}"
             else:
-                pairs.insert(0, item)
+                pairs.append(f"{key}={quote(value)}")
+        if url_pair is not None:
+            pairs.append(url_pair)
         return "&".join(pairs)
 
 
+# Commands without parameters that are sent from more than one module
+GET_PLAYERS_COMMAND: Final = HeosCommand(c.COMMAND_GET_PLAYERS)
+HEART_BEAT_COMMAND: Final = HeosCommand(c.COMMAND_HEART_BEAT)
+
+
 @dataclass(repr=False)
 class HeosMessage:
     """Lower a message received from a HEOS device. This is a lower level class used internally."""
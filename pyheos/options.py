@@ -23,6 +23,7 @@ class HeosOptions:
         auto_reconnect: Set to True to automatically reconnect if the connection is lost. The default is False. Used in conjunction with auto_reconnect_delay.
         auto_reconnect_delay: The delay in seconds before attempting to reconnect. The default is 10 seconds. Used in conjunction with auto_reconnect.
         credentials: credentials to use to automatically sign-in to the HEOS account upon successful connection. If not provided, the account will not be signed in.
+        browse_cache_ttl: The time in seconds browse results are reused before they are requested again. The default is 30 seconds. Set to 0 to disable caching.
     """
 
     host: str
@@ -40,3 +41,6 @@ class HeosOptions:
     heart_beat: bool = field(default=True, kw_only=True)
     heart_beat_interval: float = field(default=const.DEFAULT_HEART_BEAT, kw_only=True)
     credentials: Credentials | None = field(default=None, kw_only=True)
+    browse_cache_ttl: float = field(
+        default=const.DEFAULT_BROWSE_CACHE_TTL, kw_only=True
+    )
@@ -81,7 +81,7 @@ SOURCE_CONTROLS: Final = {
 }
 
 
-@dataclass
+@dataclass(slots=True)
 class PlayerUpdateResult:
     """Define the result of refreshing players.
 
@@ -96,7 +96,7 @@ class PlayerUpdateResult:
     updated_player_ids: dict[int, int] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class HeosNowPlayingMedia:
     """Define now playing media information."""
 
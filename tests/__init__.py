@@ -429,6 +429,7 @@ class CommandMatcher:
     _args: dict[str, Any] | None = field(default_factory=dict)
     responses: list[str] = field(default_factory=list)
     match_count: int = field(default=0, init=False)
+    _release: asyncio.Event | None = field(default=None, init=False)
 
     @functools.cached_property
     def args(self) -> dict[str, str] | None:
@@ -456,8 +457,15 @@ class CommandMatcher:
             self.match_count += 1
         return True
 
+    def hold(self) -> asyncio.Event:
+        """Hold responses to the command until the returned event is set."""
+        self._release = asyncio.Event()
+        return self._release
+
     async def get_response(self, query: dict) -> list[str]:
         """Get the response body."""
+        if self._release is not None:
+            await self._release.wait()
         responses = []
         for fixture in self.responses:
             responses.append(await self._get_response(fixture, query))
@@ -7,6 +7,7 @@ from typing import Any
 import pytest
 
 from pyheos import command as c
+from pyheos import connection as connection_module
 from pyheos.const import (
     EVENT_GROUP_VOLUME_CHANGED,
     EVENT_GROUPS_CHANGED,
@@ -39,6 +40,7 @@ from pyheos.error import (
 from pyheos.group import HeosGroup
 from pyheos.heos import Heos, HeosOptions, PlayerUpdateResult
 from pyheos.media import MediaItem, MediaMusicSource
+from pyheos.message import HeosMessage
 from pyheos.player import CONTROLS_ALL, CONTROLS_FORWARD_ONLY, HeosPlayer
 from pyheos.types import (
     AddCriteriaType,
@@ -100,6 +102,13 @@ async def test_validate_connection(mock_device: MockHeosDevice) -> None:
     assert system_info.hosts[1].version == "1.493.180"
 
 
+@calls_command("player.get_players")
+async def test_validate_connection_host_not_found(mock_device: MockHeosDevice) -> None:
+    """Test validate_connection raises when the connected host is not in the system."""
+    with pytest.raises(HeosError, match="Connected host not found in the system"):
+        await Heos.validate_connection("localhost")
+
+
 async def test_connect(mock_device: MockHeosDevice) -> None:
     """Test connect updates state and fires signal."""
     heos = Heos(
@@ -350,6 +359,42 @@ async def test_connection_error(mock_device: MockHeosDevice, heos: Heos) -> None
     assert heos.connection_state == ConnectionState.DISCONNECTED
 
 
+@calls_command("system.heart_beat")
+async def test_command_cancelled_during_send_releases_response(
+    heos: Heos, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test a command cancelled while sending does not block later commands."""
+    writer = heos._connection._writer
+    assert writer is not None
+    drain = writer.drain
+    draining = asyncio.Event()
+
+    async def blocking_drain() -> None:
+        draining.set()
+        await asyncio.Event().wait()
+
+    monkeypatch.setattr(writer, "drain", blocking_drain)
+    task = asyncio.create_task(heos.heart_beat())
+    await draining.wait()
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+    monkeypatch.setattr(writer, "drain", drain)
+    await heos.heart_beat()
+
+
+@calls_command("system.heart_beat")
+async def test_late_response_is_dropped(
+    heos: Heos, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test a response received after its command finished is dropped."""
+    await heos._connection._handle_message(HeosMessage(c.COMMAND_HEART_BEAT))
+
+    assert "Response received with no pending command" in caplog.text
+    await heos.heart_beat()
+
+
 async def test_connection_error_during_command(
     mock_device: MockHeosDevice, heos: Heos
 ) -> None:
@@ -362,8 +407,8 @@ async def test_connection_error_during_command(
     await mock_device.stop()
     with pytest.raises(CommandError) as e_info:
         await heos.get_players()
-    assert str(e_info.value) == "Command timed out"
-    assert isinstance(e_info.value.__cause__, asyncio.TimeoutError)
+    assert str(e_info.value) == "Connection reset while waiting for response"
+    assert isinstance(e_info.value.__cause__, ConnectionResetError)
 
     await disconnect_signal.wait()
     assert heos.connection_state == ConnectionState.DISCONNECTED
@@ -448,6 +493,32 @@ async def test_reconnect_during_command(mock_device: MockHeosDevice) -> None:
     await heos.disconnect()
 
 
+async def test_reconnect_jittered_delay_clamped(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test the jittered reconnect delay does not exceed the maximum delay."""
+    delays: list[float] = []
+
+    async def sleep(delay: float) -> None:
+        delays.append(delay)
+        raise asyncio.CancelledError
+
+    monkeypatch.setattr(connection_module.random, "uniform", lambda a, b: b)
+    monkeypatch.setattr(connection_module.asyncio, "sleep", sleep)
+    connection = connection_module.AutoReconnectingConnection(
+        "127.0.0.1",
+        timeout=0.1,
+        reconnect=True,
+        reconnect_delay=connection_module.MAX_RECONNECT_DELAY,
+        reconnect_max_attempts=0,
+        heart_beat_interval=10.0,
+    )
+
+    with pytest.raises(asyncio.CancelledError):
+        await connection._attempt_reconnect()
+    assert delays == [connection_module.MAX_RECONNECT_DELAY]
+
+
 async def test_reconnect_cancelled(mock_device: MockHeosDevice) -> None:
     """Test reconnect is canceled by calling disconnect."""
     heos = Heos(
@@ -606,6 +677,52 @@ async def test_get_players_error(heos: Heos) -> None:
     assert exc_info.value.error_text == "System error -519"
 
 
+@calls_player_commands(
+    (1,),
+    CallCommand("player.get_play_state", {c.ATTR_PLAYER_ID: 2}),
+    CallCommand("player.get_now_playing_media", {c.ATTR_PLAYER_ID: 2}),
+    CallCommand("player.get_volume", {c.ATTR_PLAYER_ID: 2}),
+    CallCommand("player.get_mute", {c.ATTR_PLAYER_ID: 2}),
+    CallCommand("player.get_play_mode_error", {c.ATTR_PLAYER_ID: 2}),
+)
+async def test_get_players_refresh_error_loads_other_players(
+    heos: Heos, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test a player failing to refresh does not prevent loading the others."""
+    players = await heos.get_players()
+    assert len(players) == 2
+    assert players[1].volume == 36
+    assert players[2].available
+    assert "Unable to refresh player 2" in caplog.text
+
+
+async def test_events_handled_in_order(
+    mock_device: MockHeosDevice, heos: Heos, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test events are handled in the order received and an error does not stop later events."""
+    received: list[str] = []
+    done = asyncio.Event()
+
+    async def callback(message: HeosMessage) -> None:
+        received.append(message.command)
+        if len(received) == 2:
+            done.set()
+        if len(received) == 1:
+            raise ValueError("Failed to handle event")
+
+    heos._connection.add_on_event(callback)
+    await mock_device.write_event(
+        "event.player_state_changed", {"player_id": 1, "state": PlayState.PLAY}
+    )
+    await mock_device.write_event(
+        "event.player_volume_changed", {"player_id": 1, "level": 10, "mute": "off"}
+    )
+
+    await done.wait()
+    assert received == [EVENT_PLAYER_STATE_CHANGED, EVENT_PLAYER_VOLUME_CHANGED]
+    assert "Unhandled error processing event" in caplog.text
+
+
 @calls_player_commands()
 async def test_player_state_changed_event(
     mock_device: MockHeosDevice, heos: Heos
@@ -977,6 +1094,30 @@ async def test_players_changed_event_new_ids(
     assert heos.players[102].name == "Front Porch"
 
 
+@calls_player_commands((1, 2, 101, 102))
+async def test_load_players_matches_players_with_same_name(
+    mock_device: MockHeosDevice, heos: Heos
+) -> None:
+    """Test players sharing a name are each matched after a firmware update."""
+    old_players = (await heos.get_players()).copy()
+    old_players[1].name = "Front Porch"
+    old_players[1].serial = None
+    mock_device.register(
+        c.COMMAND_GET_PLAYERS,
+        None,
+        "player.get_players_same_name",
+        replace=True,
+    )
+
+    result = await heos.load_players()
+
+    assert result.added_player_ids == []
+    assert result.updated_player_ids == {1: 101, 2: 102}
+    assert result.removed_player_ids == []
+    assert heos.players[101] is old_players[1]
+    assert heos.players[102] is old_players[2]
+
+
 @calls_command("browse.get_music_sources", {})
 async def test_sources_changed_event(mock_device: MockHeosDevice, heos: Heos) -> None:
     """Test sources changed fires dispatcher."""
@@ -1428,6 +1569,45 @@ async def test_get_groups(heos: Heos) -> None:
     assert not group.is_muted
 
 
+async def test_get_groups_concurrent_shares_load(
+    mock_device: MockHeosDevice, heos: Heos
+) -> None:
+    """Test concurrent calls to get groups send the command once."""
+    matcher = mock_device.register(c.COMMAND_GET_GROUPS, None, "group.get_groups")
+    mock_device.register(
+        c.COMMAND_GET_GROUP_VOLUME, {c.ATTR_GROUP_ID: 1}, "group.get_volume"
+    )
+    mock_device.register(
+        c.COMMAND_GET_GROUP_MUTE, {c.ATTR_GROUP_ID: 1}, "group.get_mute"
+    )
+    first, second = await asyncio.gather(
+        heos.get_groups(refresh=True), heos.get_groups(refresh=True)
+    )
+    assert first is second
+    assert len(first) == 1
+    assert matcher.match_count == 1
+
+
+async def test_get_groups_refresh_during_load_loads_again(
+    mock_device: MockHeosDevice, heos: Heos
+) -> None:
+    """Test a refresh requested after the groups were fetched loads them again."""
+    matcher = mock_device.register(c.COMMAND_GET_GROUPS, None, "group.get_groups")
+    mock_device.register(
+        c.COMMAND_GET_GROUP_VOLUME, {c.ATTR_GROUP_ID: 1}, "group.get_volume"
+    )
+    mock_device.register(
+        c.COMMAND_GET_GROUP_MUTE, {c.ATTR_GROUP_ID: 1}, "group.get_mute"
+    )
+    first = asyncio.create_task(heos.get_groups(refresh=True))
+    while not matcher.match_count:
+        await asyncio.sleep(0.001)
+
+    await heos.get_groups(refresh=True)
+    await first
+    assert matcher.match_count == 2
+
+
 @calls_commands(
     CallCommand("group.get_group_info", {c.ATTR_GROUP_ID: -263109739}),
     CallCommand("group.get_volume", {c.ATTR_GROUP_ID: -263109739}),
@@ -1500,6 +1680,13 @@ async def test_create_group(heos: Heos) -> None:
     await heos.create_group(1, [2, 3])
 
 
+async def test_set_group_empty_raises() -> None:
+    """Test setting a group without players raises."""
+    heos = Heos(HeosOptions("127.0.0.1"))
+    with pytest.raises(ValueError, match="'player_ids' parameter must not be empty"):
+        await heos.set_group([])
+
+
 @calls_command("group.set_group_remove", {c.ATTR_PLAYER_ID: 1})
 async def test_remove_group(heos: Heos) -> None:
     """Test removing a group."""
@@ -1,10 +1,12 @@
 """Tests for the browse mixin of the Heos module."""
 
+import asyncio
 from typing import Any
 
 import pytest
 
 from pyheos import command as c
+from pyheos.command import browse as browse_module
 from pyheos.const import (
     MUSIC_SOURCE_FAVORITES,
     MUSIC_SOURCE_NAPSTER,
@@ -27,11 +29,64 @@ from pyheos.const import (
 )
 from pyheos.heos import Heos, HeosOptions
 from pyheos.media import MediaMusicSource
-from pyheos.types import MediaType
-from tests import calls_command, value
+from pyheos.types import MediaType, SignalType
+from tests import MockHeosDevice, calls_command, value
 from tests.common import MediaMusicSources
 
 
+async def test_get_music_sources_concurrent_refresh_coalesced(
+    mock_device: MockHeosDevice, heos: Heos
+) -> None:
+    """Test concurrent refreshes of music sources share a single command."""
+    command = mock_device.register(
+        c.COMMAND_BROWSE_GET_SOURCES,
+        {c.ATTR_REFRESH: c.VALUE_ON},
+        "browse.get_music_sources",
+    )
+    await asyncio.gather(
+        heos.get_music_sources(refresh=True),
+        heos.get_music_sources(refresh=True),
+    )
+    assert command.match_count == 1
+    assert heos.music_sources
+
+
+async def test_get_music_sources_refresh_after_sent_sends_again(
+    mock_device: MockHeosDevice, heos: Heos
+) -> None:
+    """Test a refresh requested after the command was sent does not reuse its response."""
+    command = mock_device.register(
+        c.COMMAND_BROWSE_GET_SOURCES,
+        {c.ATTR_REFRESH: c.VALUE_ON},
+        "browse.get_music_sources",
+    )
+    release = command.hold()
+    first = asyncio.create_task(heos.get_music_sources(refresh=True))
+    while not command.match_count:
+        await asyncio.sleep(0)
+
+    others = asyncio.gather(
+        heos.get_music_sources(refresh=True),
+        heos.get_music_sources(refresh=True),
+    )
+    release.set()
+    await asyncio.gather(first, others)
+    assert command.match_count == 2
+
+
+async def test_get_music_sources_refresh_updates_in_place(
+    mock_device: MockHeosDevice, heos: Heos
+) -> None:
+    """Test refreshing music sources updates the dict returned by the music_sources property."""
+    mock_device.register(c.COMMAND_BROWSE_GET_SOURCES, None, "browse.get_music_sources")
+    await heos.get_music_sources()
+    music_sources = heos.music_sources
+    music_sources.clear()
+
+    assert await heos.get_music_sources(refresh=True) is music_sources
+    assert music_sources
+
+
 @calls_command("browse.get_source_info", {c.ATTR_SOURCE_ID: 123456})
 async def test_get_music_source_by_id(heos: Heos) -> None:
     """Test retrieving music source by id."""
@@ -106,6 +161,45 @@ async def test_get_search_criteria(heos: Heos) -> None:
     assert item.playable is True
 
 
+async def test_get_search_criteria_cached(
+    mock_device: MockHeosDevice, heos: Heos
+) -> None:
+    """Test search criteria are retained until refreshed."""
+    command = mock_device.register(
+        c.COMMAND_BROWSE_GET_SEARCH_CRITERIA,
+        {c.ATTR_SOURCE_ID: MUSIC_SOURCE_TIDAL},
+        "browse.get_search_criteria",
+    )
+    criteria = await heos.get_search_criteria(MUSIC_SOURCE_TIDAL)
+    assert await heos.get_search_criteria(MUSIC_SOURCE_TIDAL) is criteria
+    assert command.match_count == 1
+
+    await heos.get_search_criteria(MUSIC_SOURCE_TIDAL, refresh=True)
+    assert command.match_count == 2
+
+
+async def test_get_search_criteria_refresh_after_sent_sends_again(
+    mock_device: MockHeosDevice, heos: Heos
+) -> None:
+    """Test a search criteria refresh requested after the command was sent does not reuse its response."""
+    command = mock_device.register(
+        c.COMMAND_BROWSE_GET_SEARCH_CRITERIA,
+        {c.ATTR_SOURCE_ID: MUSIC_SOURCE_TIDAL},
+        "browse.get_search_criteria",
+    )
+    release = command.hold()
+    first = asyncio.create_task(heos.get_search_criteria(MUSIC_SOURCE_TIDAL))
+    while not command.match_count:
+        await asyncio.sleep(0)
+
+    second = asyncio.create_task(
+        heos.get_search_criteria(MUSIC_SOURCE_TIDAL, refresh=True)
+    )
+    release.set()
+    await asyncio.gather(first, second)
+    assert command.match_count == 2
+
+
 @calls_command(
     "browse.search",
     {
@@ -731,6 +825,29 @@ async def test_multi_search(heos: Heos) -> None:
     assert len(result.errors) == 2
 
 
+@calls_command(
+    "browse.multi_search",
+    {
+        c.ATTR_SEARCH: "Tangerine Rays",
+        c.ATTR_SOURCE_ID: "1,4,8,13,10",
+        c.ATTR_SEARCH_CRITERIA_ID: "0,1,2,3",
+    },
+)
+async def test_search_many(heos: Heos) -> None:
+    """Test search many groups the multi-search results by source."""
+    result = await heos.search_many(
+        "Tangerine Rays",
+        [1, 4, 8, 13, 10],
+        [0, 1, 2, 3],
+    )
+
+    assert list(result.keys()) == [1, 4, 8, 13, 10]
+    assert len(result[1]) == 57
+    assert len(result[10]) == 17
+    assert not result[4]
+    assert all(item.source_id == 10 for item in result[10])
+
+
 async def test_multi_search_invalid_search_rasis() -> None:
     """Test the multi-search c."""
     heos = Heos(HeosOptions("127.0.0.1"))
@@ -739,3 +856,244 @@ async def test_multi_search_invalid_search_rasis() -> None:
         match="'search' parameter must be less than or equal to 128 characters",
     ):
         await heos.multi_search("x" * 129)
+
+
+async def test_browse_source_cached(mock_device: MockHeosDevice, heos: Heos) -> None:
+    """Test browsing the root of a source is cached."""
+    command = mock_device.register(
+        c.COMMAND_BROWSE_BROWSE,
+        {c.ATTR_SOURCE_ID: MUSIC_SOURCE_FAVORITES},
+        "browse.browse_favorites",
+    )
+    result = await heos.browse(MUSIC_SOURCE_FAVORITES)
+    assert await heos.browse(MUSIC_SOURCE_FAVORITES) is result
+    assert len(await heos.get_favorites()) == 3
+    assert command.match_count == 1
+
+    # Refresh bypasses the cache
+    await heos.get_favorites(refresh=True)
+    assert command.match_count == 2
+
+
+@calls_command("browse.browse_favorites", {c.ATTR_SOURCE_ID: MUSIC_SOURCE_FAVORITES})
+async def test_browse_cached_result_is_immutable(heos: Heos) -> None:
+    """Test the shared cached result cannot be changed in place by a caller."""
+    result = await heos.browse(MUSIC_SOURCE_FAVORITES)
+
+    assert isinstance(result.items, tuple)
+    assert isinstance(result.options, tuple)
+    assert await heos.browse(MUSIC_SOURCE_FAVORITES) is result
+
+
+async def test_browse_source_cache_disabled(mock_device: MockHeosDevice) -> None:
+    """Test browsing the root of a source is not cached when the ttl is 0."""
+    command = mock_device.register(
+        c.COMMAND_BROWSE_BROWSE,
+        {c.ATTR_SOURCE_ID: MUSIC_SOURCE_FAVORITES},
+        "browse.browse_favorites",
+    )
+    heos = await Heos.create_and_connect(
+        "127.0.0.1", heart_beat=False, browse_cache_ttl=0
+    )
+    await heos.get_favorites()
+    await heos.get_favorites()
+    assert command.match_count == 2
+    await heos.disconnect()
+
+
+async def test_browse_cache_bounded(
+    mock_device: MockHeosDevice, heos: Heos, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test the oldest browse results are evicted once the cache is full."""
+    monkeypatch.setattr(browse_module, "_BROWSE_CACHE_MAX_SIZE", 2)
+    command = mock_device.register(
+        c.COMMAND_BROWSE_BROWSE, None, "browse.browse_favorites"
+    )
+    await heos.browse(MUSIC_SOURCE_FAVORITES, "1")
+    await heos.browse(MUSIC_SOURCE_FAVORITES, "2")
+    await heos.browse(MUSIC_SOURCE_FAVORITES, "3")
+    assert command.match_count == 3
+
+    # Most recent results are still cached, the oldest was evicted
+    await heos.browse(MUSIC_SOURCE_FAVORITES, "3")
+    assert command.match_count == 3
+    await heos.browse(MUSIC_SOURCE_FAVORITES, "1")
+    assert command.match_count == 4
+
+
+async def test_browse_in_flight_not_cached_after_clear(
+    mock_device: MockHeosDevice, heos: Heos
+) -> None:
+    """Test a browse result fetched before the cache was cleared is not stored."""
+    command = mock_device.register(
+        c.COMMAND_BROWSE_BROWSE,
+        {c.ATTR_SOURCE_ID: MUSIC_SOURCE_FAVORITES},
+        "browse.browse_favorites",
+    )
+    task = asyncio.create_task(heos.browse(MUSIC_SOURCE_FAVORITES))
+    await asyncio.sleep(0)
+    heos._clear_browse_cache()
+    await task
+
+    await heos.browse(MUSIC_SOURCE_FAVORITES)
+    assert command.match_count == 2
+
+
+async def test_browse_source_cache_cleared_on_sources_changed(
+    mock_device: MockHeosDevice, heos: Heos
+) -> None:
+    """Test the browse cache is cleared when sources change."""
+    command = mock_device.register(
+        c.COMMAND_BROWSE_BROWSE,
+        {c.ATTR_SOURCE_ID: MUSIC_SOURCE_FAVORITES},
+        "browse.browse_favorites",
+    )
+    await heos.get_favorites()
+    signal = asyncio.Event()
+
+    async def handler(event: str, data: Any) -> None:
+        signal.set()
+
+    heos.dispatcher.connect(SignalType.CONTROLLER_EVENT, handler)
+    await mock_device.write_event("event.sources_changed")
+    await signal.wait()
+
+    await heos.get_favorites()
+    assert command.match_count == 2
+
+
+@calls_command(
+    "browse.rename_playlist",
+    {
+        c.ATTR_SOURCE_ID: MUSIC_SOURCE_PLAYLISTS,
+        c.ATTR_CONTAINER_ID: 171566,
+        c.ATTR_NAME: "New Name",
+    },
+)
+async def test_browse_cache_cleared_on_rename_playlist(
+    mock_device: MockHeosDevice, heos: Heos
+) -> None:
+    """Test cached browse results of a source are cleared when it is changed."""
+    playlists = mock_device.register(
+        c.COMMAND_BROWSE_BROWSE,
+        {c.ATTR_SOURCE_ID: MUSIC_SOURCE_PLAYLISTS},
+        "browse.browse_playlists",
+    )
+    favorites = mock_device.register(
+        c.COMMAND_BROWSE_BROWSE,
+        {c.ATTR_SOURCE_ID: MUSIC_SOURCE_FAVORITES},
+        "browse.browse_favorites",
+    )
+    await heos.get_playlists()
+    await heos.get_favorites()
+
+    await heos.rename_playlist(MUSIC_SOURCE_PLAYLISTS, "171566", "New Name")
+
+    await heos.get_playlists()
+    await heos.get_favorites()
+    assert playlists.match_count == 2
+    assert favorites.match_count == 1
+
+
+async def test_browse_cached_playlists_and_favorites_not_shared(
+    mock_device: MockHeosDevice, heos: Heos
+) -> None:
+    """Test cached playlists and favorites cannot be changed through a returned value."""
+    mock_device.register(
+        c.COMMAND_BROWSE_BROWSE,
+        {c.ATTR_SOURCE_ID: MUSIC_SOURCE_PLAYLISTS},
+        "browse.browse_playlists",
+    )
+    mock_device.register(
+        c.COMMAND_BROWSE_BROWSE,
+        {c.ATTR_SOURCE_ID: MUSIC_SOURCE_FAVORITES},
+        "browse.browse_favorites",
+    )
+    playlists = await heos.get_playlists()
+    assert isinstance(playlists, tuple)
+
+    favorites = await heos.get_favorites()
+    favorites.clear()
+    assert await heos.get_favorites()
+
+
+@calls_command("player.save_queue", {c.ATTR_PLAYER_ID: 1, c.ATTR_NAME: "Test"})
+async def test_browse_cache_cleared_on_save_queue(
+    mock_device: MockHeosDevice, heos: Heos
+) -> None:
+    """Test cached playlists are cleared when a queue is saved as a playlist."""
+    playlists = mock_device.register(
+        c.COMMAND_BROWSE_BROWSE,
+        {c.ATTR_SOURCE_ID: MUSIC_SOURCE_PLAYLISTS},
+        "browse.browse_playlists",
+    )
+    await heos.get_playlists()
+
+    await heos.player_save_queue(1, "Test")
+
+    await heos.get_playlists()
+    assert playlists.match_count == 2
+
+
+async def test_browse_concurrent_coalesced(
+    mock_device: MockHeosDevice, heos: Heos
+) -> None:
+    """Test concurrent identical browses share a single command."""
+    command = mock_device.register(
+        c.COMMAND_BROWSE_BROWSE,
+        {c.ATTR_SOURCE_ID: MUSIC_SOURCE_FAVORITES},
+        "browse.browse_favorites",
+    )
+    first, second = await asyncio.gather(
+        heos.browse(MUSIC_SOURCE_FAVORITES, refresh=True),
+        heos.browse(MUSIC_SOURCE_FAVORITES, refresh=True),
+    )
+    assert first is second
+    assert command.match_count == 1
+
+
+async def test_browse_refresh_after_sent_sends_again(
+    mock_device: MockHeosDevice, heos: Heos
+) -> None:
+    """Test a browse refresh requested after the command was sent does not reuse its response."""
+    command = mock_device.register(
+        c.COMMAND_BROWSE_BROWSE,
+        {c.ATTR_SOURCE_ID: MUSIC_SOURCE_FAVORITES},
+        "browse.browse_favorites",
+    )
+    release = command.hold()
+    first = asyncio.create_task(heos.browse(MUSIC_SOURCE_FAVORITES, refresh=True))
+    while not command.match_count:
+        await asyncio.sleep(0)
+
+    second = asyncio.create_task(heos.browse(MUSIC_SOURCE_FAVORITES, refresh=True))
+    release.set()
+    first_result, second_result = await asyncio.gather(first, second)
+
+    assert command.match_count == 2
+    assert first_result is not second_result
+
+
+async def test_browse_cancelled_caller_does_not_cancel_shared_command(
+    mock_device: MockHeosDevice, heos: Heos
+) -> None:
+    """Test a cancelled caller leaves the shared browse command running for the others."""
+    command = mock_device.register(
+        c.COMMAND_BROWSE_BROWSE,
+        {c.ATTR_SOURCE_ID: MUSIC_SOURCE_FAVORITES},
+        "browse.browse_favorites",
+    )
+    release = command.hold()
+    cancelled = asyncio.create_task(heos.browse(MUSIC_SOURCE_FAVORITES, refresh=True))
+    remaining = asyncio.create_task(heos.browse(MUSIC_SOURCE_FAVORITES, refresh=True))
+    while not command.match_count:
+        await asyncio.sleep(0)
+
+    cancelled.cancel()
+    release.set()
+    result = await remaining
+
+    assert cancelled.cancelled()
+    assert result.source_id == MUSIC_SOURCE_FAVORITES
+    assert len(result.items) > 0
+    assert command.match_count == 1
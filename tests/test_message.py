@@ -5,7 +5,7 @@ import re
 import pytest
 
 from pyheos import command as c
-from pyheos.message import HeosMessage
+from pyheos.message import HeosCommand, HeosMessage
 
 
 def test_get_message_value_missing_key_raises() -> None:
@@ -17,3 +17,46 @@ def test_get_message_value_missing_key_raises() -> None:
         KeyError, match=re.escape("Key 'missing_key' not found in message parameters.")
     ):
         message.get_message_value("missing_key")
+
+
+def test_command_hash_and_equality() -> None:
+    """Test commands with the same parameters are equal and hash the same."""
+    command = HeosCommand(c.COMMAND_GET_PLAYER_INFO, {c.ATTR_PLAYER_ID: 1})
+    other = HeosCommand(c.COMMAND_GET_PLAYER_INFO, {c.ATTR_PLAYER_ID: 1})
+
+    assert command == other
+    assert hash(command) == hash(other)
+    assert command != HeosCommand(c.COMMAND_GET_PLAYER_INFO, {c.ATTR_PLAYER_ID: 2})
+    assert command.uri == "heos://player/get_player_info?pid=1"
+
+
+def test_command_parameters_read_only() -> None:
+    """Test parameters are copied and cannot be changed after the command is created."""
+    parameters = {c.ATTR_PLAYER_ID: 1}
+    command = HeosCommand(c.COMMAND_GET_PLAYER_INFO, parameters)
+    parameters[c.ATTR_PLAYER_ID] = 2
+
+    with pytest.raises(TypeError):
+        command.parameters[c.ATTR_PLAYER_ID] = 2  # type: ignore[index]
+    assert command.uri == "heos://player/get_player_info?pid=1"
+
+
+def test_command_uri_bytes() -> None:
+    """Test the encoded URI matches the URI and is cached."""
+    command = HeosCommand(c.COMMAND_GET_PLAYER_INFO, {c.ATTR_PLAYER_ID: 1})
+
+    assert command.uri_bytes == b"heos://player/get_player_info?pid=1"
+    assert command.uri_bytes is command.uri_bytes
+
+
+def test_command_uri_quotes_reserved_characters() -> None:
+    """Test reserved characters are quoted in parameters except the url."""
+    command = HeosCommand(
+        c.COMMAND_BROWSE_PLAY_STREAM,
+        {c.ATTR_NAME: "Rock & Roll=100%", c.ATTR_URL: "http://x/?a=1&b=2"},
+    )
+
+    assert (
+        command.uri
+        == "heos://browse/play_stream?name=Rock %26 Roll%3D100%25&url=http://x/?a=1&b=2"
+    )
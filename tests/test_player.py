@@ -144,6 +144,12 @@ async def test_set_mute(player: HeosPlayer, mute: bool) -> None:
     await player.set_mute(mute)
 
 
+@calls_command("player.set_mute", {c.ATTR_PLAYER_ID: 1, c.ATTR_STATE: c.VALUE_ON})
+async def test_set_mute_truthy_state(player: HeosPlayer) -> None:
+    """Test set_mute accepts a truthy state that is not a bool."""
+    await player.set_mute(2)  # type: ignore[arg-type]
+
+
 @calls_command("player.set_mute", {c.ATTR_PLAYER_ID: 1, c.ATTR_STATE: c.VALUE_ON})
 async def test_mute(player: HeosPlayer) -> None:
     """Test the mute c."""
@@ -260,6 +266,12 @@ async def test_remove_from_queue(player: HeosPlayer) -> None:
     await player.remove_from_queue([1, 2, 3])
 
 
+async def test_remove_from_queue_empty_raises(player: HeosPlayer) -> None:
+    """Test removing no items from the queue raises."""
+    with pytest.raises(ValueError, match="'queue_ids' parameter must not be empty"):
+        await player.remove_from_queue([])
+
+
 @calls_command("player.save_queue", {c.ATTR_PLAYER_ID: 1, c.ATTR_NAME: "Test"})
 async def test_save_queue(player: HeosPlayer) -> None:
     """Test the save_queue c."""
@@ -287,6 +299,14 @@ async def test_move_queue_item(player: HeosPlayer) -> None:
     await player.move_queue_item([2, 3, 4], 1)
 
 
+async def test_move_queue_item_empty_raises(player: HeosPlayer) -> None:
+    """Test moving no items in the queue raises."""
+    with pytest.raises(
+        ValueError, match="'source_queue_ids' parameter must not be empty"
+    ):
+        await player.move_queue_item([], 1)
+
+
 @calls_command("player.get_queue", {c.ATTR_PLAYER_ID: 1, c.ATTR_RANGE: "0,10"})
 async def test_get_queue_with_range(player: HeosPlayer) -> None:
     """Test the check_update c."""